@@ -83,4 +83,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Schedule the reload instead of awaiting it, so saving the options
+    # flow isn't blocked on the full platform teardown/setup round-trip.
+    # async_reload serialises per-entry, so overlapping calls are safe.
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
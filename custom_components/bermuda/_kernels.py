@@ -0,0 +1,50 @@
+"""
+Vectorized numeric kernels for Bermuda's hot loops.
+
+These are the pure-math pieces of the per-update work (path loss,
+distance adjustment, RSSI conversion) pulled out into functions that
+operate on whole NumPy arrays at a time, so the coordinator's Python
+loops only gather inputs and scatter results.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def batch_distance_adjust(
+    dev_xy: np.ndarray,
+    scn_xy: np.ndarray,
+    factors: np.ndarray,
+    walls: np.ndarray,
+) -> np.ndarray:
+    """
+    Adjusted device->scanner distances for a batch of pairs.
+
+    Applies each pair's path-loss exponent to the geometric distance,
+    then halves per wall crossed (simplified attenuation model).
+    """
+    deltas = dev_xy - scn_xy
+    distances = np.hypot(deltas[:, 0], deltas[:, 1])
+    return np.power(distances, factors) * np.power(0.5, walls)
+
+
+def batch_update_plf(
+    matrix: np.ndarray,
+    dev_idx: np.ndarray,
+    scn_idx: np.ndarray,
+    measured: np.ndarray,
+    alpha: float,
+) -> None:
+    """In-place EMA update of path-loss factors at the given matrix cells."""
+    current = matrix[dev_idx, scn_idx]
+    matrix[dev_idx, scn_idx] = current * (1 - alpha) + measured * alpha
+
+
+def rssi_to_distance(rssi, tx_power: float, attenuation: float):
+    """
+    Log-distance path loss model, elementwise over scalar or array rssi.
+
+    Mirrors util.rssi_to_metres but stays ufunc-friendly for batches.
+    """
+    return 10 ** ((tx_power - rssi) / (10 * attenuation))
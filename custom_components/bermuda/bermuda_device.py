@@ -13,8 +13,9 @@ for them, so we can use them to contribute towards measurements.
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from typing import Tuple
 
+import numpy as np
 from homeassistant.components.bluetooth import MONOTONIC_TIME, BluetoothScannerDevice
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME, STATE_UNAVAILABLE
 from homeassistant.helpers.device_registry import format_mac
@@ -33,9 +34,7 @@ from .const import (
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
     DEFAULT_DEVTRACK_TIMEOUT,
-    CONF_ENABLE_TRILATERATION,
 )
-from .trilateration import trilaterate
 
 class BermudaDevice(dict):
     """
@@ -55,6 +54,9 @@ class BermudaDevice(dict):
         self.local_name: str | None = None
         self.prefname: str | None = None  # "preferred" name - ideally local_name
         self.address: str = address
+        # Cached upper-case form, since the options flow and config matching
+        # want it repeatedly and addresses never change once created.
+        self.address_upper: str = address.upper()
         self.options = options
         self.unique_id: str | None = None  # mac address formatted.
         self.address_type = BDADDR_TYPE_UNKNOWN
@@ -74,14 +76,27 @@ class BermudaDevice(dict):
         self.beacon_major: str | None = None
         self.beacon_minor: str | None = None
         self.beacon_power: float | None = None
+        # Last-parsed (uuid_bytes, major, minor) so unchanged payloads
+        # skip re-deriving all the beacon strings on every advert.
+        self._beacon_last: tuple | None = None
 
         self.entry_id: str | None = None  # used for scanner devices
         self.create_sensor: bool = False  # Create/update a sensor for this device
         self.create_sensor_done: bool = False  # Sensor should now exist
         self.create_tracker_done: bool = False  # device_tracker should now exist
         self.last_seen: float = 0  # stamp from most recent scanner spotting. MONOTONIC_TIME
+        self._idx: int = -1  # assigned by the coordinator, indexes the path-loss matrix
         self.scanners: dict[str, BermudaDeviceScanner] = {}
 
+        # Structure-of-arrays snapshot of the numeric per-scanner fields,
+        # rebuilt once per calculate_data() pass so the trilateration and
+        # path-loss consumers don't each re-iterate the scanners dict.
+        # None becomes NaN so validity is a single mask operation.
+        self._scn_entries: list[BermudaDeviceScanner] = []
+        self._scn_rssi: np.ndarray = np.empty(0, dtype=np.float32)
+        self._scn_dist: np.ndarray = np.empty(0, dtype=np.float32)
+        self.rssi_dist_changed: bool = False  # any distance moved last calculate_data()
+
         # New attributes for trilateration
         self.trilaterated_position: Tuple[float, float, float] | None = None
         self.trilateration_accuracy: float | None = None
@@ -120,6 +135,30 @@ class BermudaDevice(dict):
         for scanner in self.scanners.values():
             scanner.calculate_data()
 
+        # Rebuild the structure-of-arrays snapshot in one pass over the dict.
+        nan = float("nan")
+        entries = list(self.scanners.values())
+        self._scn_entries = entries
+        # The rssi column carries the EMA-smoothed value where one exists,
+        # since that's what the numeric consumers (path-loss fine-tuning)
+        # want; the raw reading stays on the scanner entry for the sensors.
+        self._scn_rssi = np.array(
+            [
+                nan if scanner.rssi is None else (scanner.rssi if scanner.rssi_ema is None else scanner.rssi_ema)
+                for scanner in entries
+            ],
+            dtype=np.float32,
+        )
+        old_dist = self._scn_dist
+        self._scn_dist = np.array(
+            [nan if scanner.rssi_distance is None else scanner.rssi_distance for scanner in entries],
+            dtype=np.float32,
+        )
+        # Flag whether any smoothed distance actually moved this pass, so
+        # the coordinator's area refresh can skip devices whose adverts
+        # didn't change the numbers.
+        self.rssi_dist_changed = not np.array_equal(self._scn_dist, old_dist, equal_nan=True)
+
         # Update whether the device has been seen recently, for device_tracker:
         if (
             self.last_seen is not None
@@ -129,37 +168,12 @@ class BermudaDevice(dict):
         else:
             self.zone = STATE_NOT_HOME
 
-        if self.address.upper() in self.options.get(CONF_DEVICES, []):
+        if self.address_upper in self.options.get(CONF_DEVICES, []):
             # We are a device we track. Flag for set-up:
             self.create_sensor = True
 
-        # Perform trilateration if enabled
-        if self.options.get(CONF_ENABLE_TRILATERATION, False):
-            self.perform_trilateration()
-
-    def perform_trilateration(self):
-        """
-        Perform trilateration calculations using data from multiple scanners.
-        """
-        positions: List[Tuple[float, float, float]] = []
-        distances: List[float] = []
-
-        for scanner in self.scanners.values():
-            if scanner.rssi_distance is not None and hasattr(scanner, 'position'):
-                positions.append(scanner.position)
-                distances.append(scanner.rssi_distance)
-
-        if len(positions) >= 3:
-            try:
-                self.trilaterated_position = trilaterate(positions, distances)
-                if self.trilaterated_position:
-                    _LOGGER.debug(f"Trilaterated position for {self.address}: {self.trilaterated_position}")
-                else:
-                    _LOGGER.warning(f"Trilateration failed for {self.address}")
-            except Exception as e:
-                _LOGGER.error(f"Error during trilateration for {self.address}: {str(e)}")
-        else:
-            _LOGGER.debug(f"Not enough data for trilateration of {self.address}. Scanners with distance data: {len(positions)}")
+        # Trilateration happens in the coordinator's batched solve, which
+        # knows the scanner positions; nothing more to do here.
 
     def update_scanner(self, scanner_device: BermudaDevice, discoveryinfo: BluetoothScannerDevice):
         """
@@ -193,6 +207,10 @@ class BermudaDevice(dict):
         """Convert class to serialisable dict for dump_devices."""
         out = {}
         for var, val in vars(self).items():
+            if var.startswith(("_scn_", "_beacon_last")):
+                # Internal scratch state - numpy arrays and raw bytes that
+                # aren't serialisable (and are duplicated elsewhere anyway).
+                continue
             if var == "scanners":
                 scanout = {}
                 for address, scanner in self.scanners.items():
@@ -21,6 +21,7 @@ from .const import (
     CONF_REF_POWER,
     CONF_RSSI_OFFSETS,
     CONF_SMOOTHING_SAMPLES,
+    DEFAULT_SMOOTHING_SAMPLES,
     DISTANCE_INFINITE,
     DISTANCE_TIMEOUT,
     HIST_KEEP_COUNT,
@@ -66,6 +67,7 @@ class BermudaDeviceScanner(dict):
         self.new_stamp: float | None = None  # Set when a new advert is loaded from update
         self.hist_stamp = []
         self.rssi: float | None = None
+        self.rssi_ema: float | None = None  # single-pole IIR smoothed rssi
         self.hist_rssi = []
         self.hist_distance = []
         self.hist_distance_by_interval = []  # updated per-interval
@@ -143,6 +145,15 @@ class BermudaDeviceScanner(dict):
             # this is the first entry or a new one...
 
             self.rssi = scandata.advertisement.rssi
+            # Streaming EMA of the rssi: one multiply-add per advert with no
+            # sample buffer, for consumers that want a steadier value than
+            # the raw reading. Alpha derives from the existing
+            # smoothing_samples option via the usual 2/(N+1) equivalence.
+            if self.rssi_ema is None:
+                self.rssi_ema = float(self.rssi)
+            else:
+                alpha = 2 / (self.options.get(CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES) + 1)
+                self.rssi_ema += alpha * (self.rssi - self.rssi_ema)
             self.hist_rssi.insert(0, self.rssi)
             self.rssi_distance_raw = rssi_to_metres(
                 self.rssi + self.options.get(CONF_RSSI_OFFSETS, {}).get(self.address, 0),
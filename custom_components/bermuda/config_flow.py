@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.components.bluetooth import MONOTONIC_TIME, BluetoothServiceInfoBleak
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 from homeassistant.config_entries import ConfigEntry, OptionsFlowWithConfigEntry
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
@@ -21,9 +21,6 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
-    ADDR_TYPE_IBEACON,
-    ADDR_TYPE_PRIVATE_BLE_DEVICE,
-    BDADDR_TYPE_PRIVATE_RESOLVABLE,
     CONF_ATTENUATION,
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
@@ -58,6 +55,33 @@ if TYPE_CHECKING:
     from .bermuda_device import BermudaDevice
     from .coordinator import BermudaDataUpdateCoordinator
 
+# Coercers are stateless, so share single instances across every schema
+# build rather than constructing fresh ones per render.
+_FLOAT_COERCE = vol.Coerce(float)
+_INT_COERCE = vol.Coerce(int)
+_BOOL_COERCE = vol.Coerce(bool)
+
+# (option key, fallback default, validator) triples for the globalopts form,
+# so the schema can be built in one pass and memoised against the defaults.
+_GLOBALOPTS_SPEC = (
+    (CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS, _FLOAT_COERCE),
+    (CONF_MAX_VELOCITY, DEFAULT_MAX_VELOCITY, _FLOAT_COERCE),
+    (CONF_DEVTRACK_TIMEOUT, DEFAULT_DEVTRACK_TIMEOUT, _INT_COERCE),
+    (CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, _FLOAT_COERCE),
+    (CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES, _INT_COERCE),
+    (CONF_ATTENUATION, DEFAULT_ATTENUATION, _FLOAT_COERCE),
+    (CONF_REF_POWER, DEFAULT_REF_POWER, _FLOAT_COERCE),
+    (CONF_ENABLE_TRILATERATION, DEFAULT_ENABLE_TRILATERATION, bool),
+)
+
+# The options menu never changes, so build it once.
+_INIT_MENU_OPTIONS = {
+    "globalopts": "Global Options",
+    "selectdevices": "Select Devices",
+    "calibration1_global": "Calibration 1: Global",
+    "calibration2_scanners": "Calibration 2: Scanner RSSI Offsets",
+}
+
 
 class BermudaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for bermuda."""
@@ -100,27 +124,40 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize HACS options flow."""
         super().__init__(config_entry)
-        self.coordinator: BermudaDataUpdateCoordinator
-        self.devices: dict[str, BermudaDevice]
+        self._coordinator: BermudaDataUpdateCoordinator | None = None
         self._last_ref_power = None
         self._last_device = None
         self._last_scanner = None
         self._last_attenuation = None
         self._last_scanner_info = None
+        # Cached (key, value) pairs so re-renders of a form (eg after a
+        # validation error) don't rebuild and re-sort the whole list.
+        self._device_options_cache: tuple[tuple, list[SelectOptionDict]] | None = None
+        self._scanner_options_cache: tuple[tuple, list[SelectOptionDict]] | None = None
+        self._globalopts_schema_cache: tuple[tuple, vol.Schema] | None = None
+
+    @property
+    def coordinator(self) -> BermudaDataUpdateCoordinator:
+        """
+        Resolve the coordinator lazily, on first use.
+
+        The init step only renders a menu and globalopts never touches
+        coordinator state, so don't look it up until a step needs it.
+        """
+        if self._coordinator is None:
+            self._coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+        return self._coordinator
+
+    @property
+    def devices(self) -> dict[str, BermudaDevice]:
+        """The coordinator's device list."""
+        return self.coordinator.devices
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
-        self.coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-        self.devices = self.coordinator.devices
-
         return self.async_show_menu(
             step_id="init",
-            menu_options={
-                "globalopts": "Global Options",
-                "selectdevices": "Select Devices",
-                "calibration1_global": "Calibration 1: Global",
-                "calibration2_scanners": "Calibration 2: Scanner RSSI Offsets",
-            },
+            menu_options=_INIT_MENU_OPTIONS,
         )
 
     async def async_step_globalopts(self, user_input=None):
@@ -129,42 +166,23 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             self.options.update(user_input)
             return await self._update_options()
 
-        data_schema = {
-            vol.Required(
-                CONF_MAX_RADIUS,
-                default=self.options.get(CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS),
-            ): vol.Coerce(float),
-            vol.Required(
-                CONF_MAX_VELOCITY,
-                default=self.options.get(CONF_MAX_VELOCITY, DEFAULT_MAX_VELOCITY),
-            ): vol.Coerce(float),
-            vol.Required(
-                CONF_DEVTRACK_TIMEOUT,
-                default=self.options.get(CONF_DEVTRACK_TIMEOUT, DEFAULT_DEVTRACK_TIMEOUT),
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_UPDATE_INTERVAL,
-                default=self.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-            ): vol.Coerce(float),
-            vol.Required(
-                CONF_SMOOTHING_SAMPLES,
-                default=self.options.get(CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES),
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_ATTENUATION,
-                default=self.options.get(CONF_ATTENUATION, DEFAULT_ATTENUATION),
-            ): vol.Coerce(float),
-            vol.Required(
-                CONF_REF_POWER,
-                default=self.options.get(CONF_REF_POWER, DEFAULT_REF_POWER),
-            ): vol.Coerce(float),
-            vol.Required(
-                CONF_ENABLE_TRILATERATION,
-                default=self.options.get(CONF_ENABLE_TRILATERATION, DEFAULT_ENABLE_TRILATERATION),
-            ): bool,
-        }
+        # The schema only varies with the current option values (they set the
+        # form defaults), so rebuild it only when those change. Bind the
+        # lookup once; LOAD_FAST beats the attribute/dict chain per key.
+        opts_get = self.options.get
+        defaults = tuple(opts_get(key, fallback) for key, fallback, _ in _GLOBALOPTS_SPEC)
+        if self._globalopts_schema_cache is not None and self._globalopts_schema_cache[0] == defaults:
+            data_schema = self._globalopts_schema_cache[1]
+        else:
+            data_schema = vol.Schema(
+                {
+                    vol.Required(key, default=default): validator
+                    for (key, _, validator), default in zip(_GLOBALOPTS_SPEC, defaults)
+                }
+            )
+            self._globalopts_schema_cache = (defaults, data_schema)
 
-        return self.async_show_form(step_id="globalopts", data_schema=vol.Schema(data_schema))
+        return self.async_show_form(step_id="globalopts", data_schema=data_schema)
 
     async def async_step_selectdevices(self, user_input=None):
         """Handle device selection flow."""
@@ -172,61 +190,89 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             self.options.update(user_input)
             return await self._update_options()
 
-        options_list = []
-        options_metadevices = []
-        options_otherdevices = []
-        options_randoms = []
-
-        for device in self.devices.values():
+        # The device list only changes when the coordinator updates, so
+        # serve the previously-built list if nothing has moved since.
+        cache_key = (len(self.devices), self.coordinator.stamp_last_update)
+        if self._device_options_cache is not None and self._device_options_cache[0] == cache_key:
+            return self._async_show_selectdevices(self._device_options_cache[1])
+
+        # Staged as (category_rank, option) so one sort orders the list as
+        # metadevices, then other devices, then random MACs, each by label.
+        staged_options: list[tuple[int, SelectOptionDict]] = []
+        # Values already added to an option, so the saved-devices loop below
+        # can dedupe with an O(1) set lookup instead of scanning the list.
+        seen_values: set[str] = set()
+        # Random MACs rotate; the coordinator tracks which ones are recent
+        # enough to be worth offering.
+        recent_randoms = self.coordinator.recent_randoms
+
+        # The coordinator keeps pre-classified views of the device list, so
+        # each category is a tight loop over only the devices it can offer.
+        for device in self.coordinator.selectable_ibeacons.values():
             name = device.prefname or device.name or ""
-
-            if device.is_scanner:
-                continue
-            if device.address_type == ADDR_TYPE_PRIVATE_BLE_DEVICE:
-                continue
-            if device.address_type == ADDR_TYPE_IBEACON:
-                source_mac = f"[{device.beacon_sources[0].upper()}]" if device.beacon_sources else ""
-                options_metadevices.append(
-                    SelectOptionDict(
-                        value=device.address.upper(),
-                        label=f"iBeacon: {device.address.upper()} {source_mac} "
-                        f"{name if device.address.upper() != name.upper() else ''}",
-                    )
+            addr_upper = device.address_upper
+            source_mac = f"[{device.beacon_sources[0].upper()}]" if device.beacon_sources else ""
+            trailing_name = name if addr_upper != name.upper() else ""
+            staged_options.append(
+                (
+                    0,
+                    # TypedDicts are plain dicts at runtime; literals skip the
+                    # constructor-call overhead in these loops. Labels are
+                    # joined rather than f-strings - join of a tuple is a
+                    # single C-level concatenation.
+                    {
+                        "value": addr_upper,
+                        "label": "".join(("iBeacon: ", addr_upper, " ", source_mac, " ", trailing_name)),
+                    },
                 )
-                continue
+            )
+            seen_values.add(addr_upper)
 
-            if device.address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
-                if device.last_seen < MONOTONIC_TIME() - (60 * 60 * 2):
-                    continue
-                options_randoms.append(
-                    SelectOptionDict(
-                        value=device.address.upper(),
-                        label=f"[{device.address.upper()}] {name} (Random MAC)",
-                    )
+        for device in self.coordinator.selectable_other.values():
+            name = device.prefname or device.name or ""
+            addr_upper = device.address_upper
+            staged_options.append(
+                (
+                    1,
+                    {
+                        "value": addr_upper,
+                        "label": "".join(("[", addr_upper, "] ", name)),
+                    },
                 )
-                continue
+            )
+            seen_values.add(addr_upper)
 
-            options_otherdevices.append(
-                SelectOptionDict(
-                    value=device.address.upper(),
-                    label=f"[{device.address.upper()}] {name}",
+        for device in self.coordinator.selectable_randoms.values():
+            if device.address not in recent_randoms:
+                continue
+            name = device.prefname or device.name or ""
+            addr_upper = device.address_upper
+            staged_options.append(
+                (
+                    2,
+                    {
+                        "value": addr_upper,
+                        "label": "".join(("[", addr_upper, "] ", name, " (Random MAC)")),
+                    },
                 )
             )
+            seen_values.add(addr_upper)
 
-        options_metadevices.sort(key=lambda item: item["label"])
-        options_otherdevices.sort(key=lambda item: item["label"])
-        options_randoms.sort(key=lambda item: item["label"])
-        options_list.extend(options_metadevices)
-        options_list.extend(options_otherdevices)
-        options_list.extend(options_randoms)
+        staged_options.sort(key=lambda staged: (staged[0], staged[1]["label"]))
+        options_list = [option for _, option in staged_options]
 
-        for address in self.options.get(CONF_DEVICES, []):
-            if not next(
-                (item for item in options_list if item["value"] == address.upper()),
-                False,
-            ):
-                options_list.append(SelectOptionDict(value=address.upper(), label=f"[{address}] (saved)"))
+        append_option = options_list.append
+        for address in self.options.get(CONF_DEVICES, ()):
+            addr_upper = address.upper()
+            if addr_upper not in seen_values:
+                append_option({"value": addr_upper, "label": f"[{address}] (saved)"})
+                seen_values.add(addr_upper)
 
+        self._device_options_cache = (cache_key, options_list)
+        return self._async_show_selectdevices(options_list)
+
+    def _async_show_selectdevices(self, options_list: list[SelectOptionDict]):
+        """Render the selectdevices form for a given list of device options."""
         data_schema = {
             vol.Optional(
                 CONF_DEVICES,
@@ -253,13 +299,18 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             self._last_device = user_input[CONF_DEVICES]
             self._last_scanner = user_input[CONF_SCANNERS]
 
-        scanner_options = [
-            SelectOptionDict(
-                value=scanner,
-                label=self.coordinator.devices[scanner].name if scanner in self.coordinator.devices else scanner,
-            )
-            for scanner in self.coordinator.scanner_list
-        ]
+        opts_get = self.options.get
+
+        scanner_cache_key = (len(self.coordinator.scanner_list), self.coordinator.stamp_last_update)
+        if self._scanner_options_cache is not None and self._scanner_options_cache[0] == scanner_cache_key:
+            scanner_options = self._scanner_options_cache[1]
+        else:
+            devices = self.coordinator.devices
+            scanner_options = []
+            for scanner in self.coordinator.scanner_list:
+                dev = devices.get(scanner)
+                scanner_options.append({"value": scanner, "label": dev.name if dev else scanner})
+            self._scanner_options_cache = (scanner_cache_key, scanner_options)
         data_schema = {
             vol.Required(
                 CONF_DEVICES,
@@ -279,15 +330,15 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 CONF_REF_POWER,
                 default=self._last_ref_power
                 if self._last_ref_power is not None
-                else self.options.get(CONF_REF_POWER, DEFAULT_REF_POWER),
-            ): vol.Coerce(float),
+                else opts_get(CONF_REF_POWER, DEFAULT_REF_POWER),
+            ): _FLOAT_COERCE,
             vol.Required(
                 CONF_ATTENUATION,
                 default=self._last_attenuation
                 if self._last_attenuation is not None
-                else self.options.get(CONF_ATTENUATION, DEFAULT_ATTENUATION),
-            ): vol.Coerce(float),
-            vol.Optional(CONF_SAVE_AND_CLOSE, default=False): vol.Coerce(bool),
+                else opts_get(CONF_ATTENUATION, DEFAULT_ATTENUATION),
+            ): _FLOAT_COERCE,
+            vol.Optional(CONF_SAVE_AND_CLOSE, default=False): _BOOL_COERCE,
         }
 
         return self.async_show_form(
@@ -311,11 +362,11 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
             self._last_device = user_input[CONF_DEVICES]
 
         saved_rssi_offsets = self.options.get(CONF_RSSI_OFFSETS, {})
-        rssi_offset_dict = {}
-
-        for scanner in self.coordinator.scanner_list:
-            scanner_name = self.coordinator.devices[scanner].name
-            rssi_offset_dict[scanner_name] = saved_rssi_offsets.get(scanner, 0)
+        coordinator = self.coordinator
+        devices = coordinator.devices
+        rssi_offset_dict = {
+            devices[scanner].name: saved_rssi_offsets.get(scanner, 0) for scanner in coordinator.scanner_list
+        }
         data_schema = {
             vol.Required(
                 CONF_DEVICES,
@@ -325,7 +376,7 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 CONF_SCANNER_INFO,
                 default=rssi_offset_dict if not self._last_scanner_info else self._last_scanner_info,
             ): ObjectSelector(),
-            vol.Optional(CONF_SAVE_AND_CLOSE, default=False): vol.Coerce(bool),
+            vol.Optional(CONF_SAVE_AND_CLOSE, default=False): _BOOL_COERCE,
         }
 
         return self.async_show_form(
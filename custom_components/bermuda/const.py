@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from enum import IntEnum
 from typing import Final
 
 from .log_spam_less import BermudaLogSpamLess
@@ -39,7 +40,9 @@ PLATFORMS = [SENSOR, DEVICE_TRACKER]
 DOMAIN_PRIVATE_BLE_DEVICE = "private_ble_device"
 
 # Signal names we are using:
-SIGNAL_DEVICE_NEW = f"{DOMAIN}-device-new"
+# Carries a list of new addresses plus the scanner list, so one dispatch
+# covers every device found in an update cycle.
+SIGNAL_DEVICE_NEW_BATCH = f"{DOMAIN}-device-new-batch"
 
 DISTANCE_TIMEOUT = 30  # seconds to wait before marking a sensor distance measurement
 # as unknown/none/stale/away. Separate from device_tracker.
@@ -67,14 +70,30 @@ BEACON_IBEACON_DEVICE: Final = "beacon device"  # The meta-device created to tra
 BEACON_PRIVATE_BLE_SOURCE: Final = "private_ble_src"  # current (random) MAC of a private ble device
 BEACON_PRIVATE_BLE_DEVICE: Final = "private_ble_device"  # meta-device create to track private ble device
 
-# Bluetooth Device Address Type - classify MAC addresses
-BDADDR_TYPE_UNKNOWN: Final = "bd_addr_type_unknown"  # uninitialised
-BDADDR_TYPE_OTHER: Final = "bd_addr_other"  # Default 48bit MAC
-BDADDR_TYPE_PRIVATE_RESOLVABLE: Final = "bd_addr_private_resolvable"
-BDADDR_TYPE_NOT_MAC48: Final = "bd_addr_not_mac48"
-# Non-bluetooth address types - for our metadevice entries
-ADDR_TYPE_IBEACON: Final = "addr_type_ibeacon"
-ADDR_TYPE_PRIVATE_BLE_DEVICE: Final = "addr_type_private_ble_device"
+# Bluetooth Device Address Type - classify MAC addresses.
+# Small ints so the per-device comparisons on the update/prune hot paths
+# are integer equality rather than string compares.
+
+
+class AddrType(IntEnum):
+    """Classification of a device's address."""
+
+    UNKNOWN = 0  # uninitialised
+    OTHER = 1  # Default 48bit MAC
+    PRIVATE_RESOLVABLE = 2
+    NOT_MAC48 = 3
+    # Non-bluetooth address types - for our metadevice entries
+    IBEACON = 4
+    PRIVATE_BLE_DEVICE = 5
+
+
+# Keep the established constant names as aliases so call-sites read the same.
+BDADDR_TYPE_UNKNOWN: Final = AddrType.UNKNOWN
+BDADDR_TYPE_OTHER: Final = AddrType.OTHER
+BDADDR_TYPE_PRIVATE_RESOLVABLE: Final = AddrType.PRIVATE_RESOLVABLE
+BDADDR_TYPE_NOT_MAC48: Final = AddrType.NOT_MAC48
+ADDR_TYPE_IBEACON: Final = AddrType.IBEACON
+ADDR_TYPE_PRIVATE_BLE_DEVICE: Final = AddrType.PRIVATE_BLE_DEVICE
 
 # Device entry pruning. Letting the gathered list of devices grow forever makes the
 # processing loop slower. It doesn't seem to have as much impact on memory, but it
@@ -90,6 +109,9 @@ PRUNE_TIME_INTERVAL = 310  # Every 5m10s, prune stale devices
 PRUNE_TIME_DEFAULT = 259200  # Max age of regular device entries (3days)
 PRUNE_TIME_IRK = 3600  # Resolvable Private addresses change often, prune regularly (1h)
 
+RECENT_RANDOMS_WINDOW = 60 * 60 * 2  # How recently a random MAC must have been
+# seen for us to bother offering it in the device-selection options flow.
+
 DOCS = {}
 
 
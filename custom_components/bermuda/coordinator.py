@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 import re
+import struct
 from collections.abc import Callable
+from functools import lru_cache
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import TYPE_CHECKING, cast
-import math
 
+import numpy as np
 import voluptuous as vol
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import MONOTONIC_TIME, BluetoothChange, BluetoothScannerDevice
@@ -36,10 +40,12 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import slugify
 from homeassistant.util.dt import get_age, now
 
+from ._kernels import batch_distance_adjust, batch_update_plf, rssi_to_distance
 from .bermuda_device import BermudaDevice
 from .const import (
     _LOGGER,
     _LOGGER_SPAM_LESS,
+    ADDR_TYPE_IBEACON,
     ADDR_TYPE_PRIVATE_BLE_DEVICE,
     BDADDR_TYPE_NOT_MAC48,
     BDADDR_TYPE_PRIVATE_RESOLVABLE,
@@ -72,9 +78,11 @@ from .const import (
     PRUNE_TIME_DEFAULT,
     PRUNE_TIME_INTERVAL,
     PRUNE_TIME_IRK,
-    SIGNAL_DEVICE_NEW,
+    RECENT_RANDOMS_WINDOW,
+    SIGNAL_DEVICE_NEW_BATCH,
     UPDATE_INTERVAL,
 )
+from .trilateration import trilaterate, trilaterate_batch
 from .util import clean_charbuf
 
 if TYPE_CHECKING:
@@ -87,6 +95,82 @@ if TYPE_CHECKING:
 Cancellable = Callable[[], None]
 
 
+def _copy_meta_attrs(metadev: BermudaDevice, source_device: BermudaDevice) -> None:
+    """
+    Sync a metadevice's attributes from its current source device.
+
+    Every attribute touched here is set unconditionally in
+    BermudaDevice.__init__, so this is straight-line assignment rather
+    than the old hasattr/getattr/setattr loop, which cost three
+    string-keyed lookups per attribute per metadevice per update.
+    """
+    # Naming details are only adopted if we don't have one yet.
+    if metadev.local_name in (None, False):
+        metadev.local_name = source_device.local_name
+    if metadev.manufacturer in (None, False):
+        metadev.manufacturer = source_device.manufacturer
+    if metadev.name in (None, False):
+        metadev.name = source_device.name
+    if metadev.prefname in (None, False):
+        metadev.prefname = source_device.prefname
+
+    # Live measurement state always tracks the source.
+    metadev.area_distance = source_device.area_distance
+    metadev.area_id = source_device.area_id
+    metadev.area_name = source_device.area_name
+    metadev.area_rssi = source_device.area_rssi
+    metadev.area_scanner = source_device.area_scanner
+    metadev.beacon_major = source_device.beacon_major
+    metadev.beacon_minor = source_device.beacon_minor
+    metadev.beacon_power = source_device.beacon_power
+    metadev.beacon_unique_id = source_device.beacon_unique_id
+    metadev.beacon_uuid = source_device.beacon_uuid
+    metadev.connectable = source_device.connectable
+    metadev.zone = source_device.zone
+
+# iBeacon payload after the 0x02 0x15 prefix: 16-byte UUID, big-endian
+# unsigned major and minor, and a signed power byte. One C-level unpack
+# replaces four slice/int.from_bytes conversions per advert.
+_IBEACON_STRUCT = struct.Struct("!16sHHb")
+
+# Device-registry connection types that carry a MAC address.
+_MAC_CONNECTION_TYPES = frozenset({"mac", "bluetooth"})
+
+
+@lru_cache(maxsize=2048)
+def _format_mac_cached(raw: str) -> str:
+    """
+    Memoised format_mac() for the registry-index rebuild.
+
+    The same connection strings recur across every rebuild; format_mac
+    is pure, so the cache never needs invalidating.
+    """
+    return format_mac(raw)
+
+# How many update cycles between full-population area refreshes. Between
+# full passes only devices with changed distances are re-derived.
+_AREA_FULL_REFRESH_TICKS = 10
+
+# The config-entry options we load into our own options dict at startup.
+_LOADABLE_OPTIONS = frozenset(
+    {
+        CONF_ATTENUATION,
+        CONF_DEVICES,
+        CONF_DEVTRACK_TIMEOUT,
+        CONF_MAX_RADIUS,
+        CONF_MAX_VELOCITY,
+        CONF_REF_POWER,
+        CONF_SMOOTHING_SAMPLES,
+        CONF_RSSI_OFFSETS,
+    }
+)
+
+# Any MAC addresses not covered by specific redactions get squashed with
+# this. Compiled once at import rather than per coordinator instance.
+_REDACT_GENERIC_RE = re.compile(r"(?P<start>[0-9A-Fa-f]{2}):([0-9A-Fa-f]{2}:){4}(?P<end>[0-9A-Fa-f]{2})")
+_REDACT_GENERIC_SUB = r"\g<start>:xx:xx:xx:xx:\g<end>"
+
+
 class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
     """
     Class to manage fetching data from the Bluetooth component.
@@ -120,19 +204,68 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         # match/replacement pairs for redacting addresses
         self.redactions: dict[str, str] = {}
-        # Any remaining MAC addresses will be replaced with this. We define it here
-        # so we can compile it once.
-        self._redact_generic_re = re.compile(r"(?P<start>[0-9A-Fa-f]{2}):([0-9A-Fa-f]{2}:){4}(?P<end>[0-9A-Fa-f]{2})")
-        self._redact_generic_sub = r"\g<start>:xx:xx:xx:xx:\g<end>"
+        # Keep the old attribute names as aliases of the module-level
+        # pattern, compiled once at import instead of per instance.
+        self._redact_generic_re = _REDACT_GENERIC_RE
+        self._redact_generic_sub = _REDACT_GENERIC_SUB
 
         self.stamp_last_update: float = 0  # Last time we ran an update, from MONOTONIC_TIME()
         self.stamp_last_prune: float = 0  # When we last pruned device list
 
+        # Bumped on every incoming advert so the update cycle can tell if
+        # anything actually arrived since it last ran, and a pending flag so
+        # an advert burst schedules at most one extra update pass.
+        self._advert_seq: int = 0
+        self._last_processed_advert_seq: int = -1
+        self._advert_kick_pending: bool = False
+
         # New attributes for path loss and obstruction map
-        self.path_loss_factors: dict[str, float] = {}
         self.obstruction_map: dict[tuple[float, float], float] = {}
         self.fixed_beacons: list[str] = []
 
+        # Path loss factors live in a dense matrix indexed by the integer
+        # ids handed out in _get_or_create_device, so the per-advert lookups
+        # don't build and hash a string key per pairing. Grown on demand,
+        # defaulting to the free-space exponent of 2.0.
+        self._device_idx_counter = 0
+        # Indices released by prune_devices, reused before minting new
+        # ones so the matrix stays bounded by the live device count even
+        # under random-MAC churn.
+        self._free_device_idxs: list[int] = []
+        self._pl_matrix: np.ndarray = np.full((8, 8), 2.0, dtype=np.float32)
+
+        # The primary (most recent) source address of every metadevice,
+        # maintained where beacon_sources is updated, so pruning doesn't
+        # rebuild the set from every metadevice's source list each pass.
+        self._metadevice_primos: set[str] = set()
+
+        # Matched monotonic/wall-clock instants captured once per update
+        # cycle, for converting stamps without repeated clock reads.
+        self._time_anchor: tuple[float, datetime] | None = None
+
+        # Contiguous SoA copy of the positions of scanners that have one,
+        # with an address -> row map. Rebuilt by _refresh_scanners, so the
+        # trilateration gather fancy-indexes into one array instead of
+        # walking device objects.
+        self._scanner_xyz: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        self._scanner_index: dict[str, int] = {}
+
+        # Addresses that received an advert since the last pass, so the
+        # per-device recalculation loop can skip everything else.
+        self._dirty_devices: set[str] = set()
+
+        # Memoised format_mac() results. Every advert triggers at least one
+        # device lookup, and the same raw address strings recur constantly,
+        # so cache the normalised form rather than re-parsing each time.
+        self._norm_cache: dict[str, str] = {}
+
+        # Array mirror of obstruction_map so nearest-point lookups are a
+        # vectorized argmin rather than a Python min() over every key.
+        # Rebuilt lazily when the map's size changes.
+        self._obstruction_points: np.ndarray | None = None
+        self._obstruction_values: np.ndarray | None = None
+        self._obstruction_len: int = -1
+
         super().__init__(
             hass,
             _LOGGER,
@@ -148,6 +281,19 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.metadevices: dict[str, BermudaDevice] = {}
 
+        # Random (private-resolvable) MACs seen within RECENT_RANDOMS_WINDOW.
+        # Maintained each update cycle so the options flow can do a set
+        # membership test instead of per-device staleness arithmetic.
+        self.recent_randoms: set[str] = set()
+
+        # Pre-classified views over self.devices so the options flow can
+        # iterate just the devices it can offer, rather than filtering the
+        # whole device list on every render. Scanners and Private BLE
+        # metadevices are excluded; everything else lands in one bucket.
+        self.selectable_ibeacons: dict[str, BermudaDevice] = {}
+        self.selectable_randoms: dict[str, BermudaDevice] = {}
+        self.selectable_other: dict[str, BermudaDevice] = {}
+
         self._ad_listener_cancel: Cancellable | None = None
 
         @callback
@@ -187,6 +333,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # any there for us to track.
         self._do_private_device_init = True
 
+        # Reverse index of mac address -> registry entry, built lazily and
+        # invalidated on registry changes, so scanner refreshes do an O(1)
+        # lookup per address instead of walking the whole registry.
+        self._devreg_by_mac: dict[str, dr.DeviceEntry] | None = None
+
+        # Devices whose smoothed distances moved in the current cycle -
+        # the only ones whose closest-scanner result can have changed.
+        self._rssi_dirty: set[str] = set()
+        self._area_refresh_tick: int = 0
+
+        # Registry ids of the devices we actually care about (scanners and
+        # Private BLE Devices), so registry chatter about anything else
+        # doesn't trigger a full scanner/metadevice re-init.
+        self._tracked_devreg_ids: set[str] = set()
+
         @callback
         def handle_devreg_changes(ev: Event[EventDeviceRegistryUpdatedData]):
             """
@@ -195,12 +356,17 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             This catches area changes (on scanners) and any new/changed
             Private BLE Devices.
             """
-            # TODO: Ignore the below, and implement filtering. This gets
-            # called a "fair number" of times each time we get reloaded.
-            #
-            # We could try filtering on "updates" and "area" but I doubt
-            # this will fire all that often, and even when it does fire
-            # the difference in cycle time appears to be less than 1ms.
+            # Any registry change can alter connections - even on devices
+            # we don't track yet, one might gain a MAC we care about - so
+            # drop the reverse index before filtering. It's one attribute
+            # store, and the rebuild stays lazy.
+            self._devreg_by_mac = None
+            device_id = ev.data.get("device_id")
+            if ev.data.get("action") == "update" and device_id is not None and device_id not in self._tracked_devreg_ids:
+                # An update to a device we don't track can't affect our
+                # scanners or metadevices. Creations and removals still
+                # trigger a re-init, since we won't know those ids yet.
+                return
             _LOGGER.debug(
                 "Device registry has changed, we will reload scanners and Private BLE Devs. ev: %s",
                 ev,
@@ -235,23 +401,16 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         self.options[CONF_UPDATE_INTERVAL] = DEFAULT_UPDATE_INTERVAL
         self.options[CONF_RSSI_OFFSETS] = {}
 
-        if hasattr(entry, "options"):
-            # Firstly, on some calls (specifically during reload after settings changes)
-            # we seem to get called with a non-existant config_entry.
-            # Anyway... if we DO have one, convert it to a plain dict so we can
-            # serialise it properly when it goes into the device and scanner classes.
-            for key, val in entry.options.items():
-                if key in (
-                    CONF_ATTENUATION,
-                    CONF_DEVICES,
-                    CONF_DEVTRACK_TIMEOUT,
-                    CONF_MAX_RADIUS,
-                    CONF_MAX_VELOCITY,
-                    CONF_REF_POWER,
-                    CONF_SMOOTHING_SAMPLES,
-                    CONF_RSSI_OFFSETS,
-                ):
-                    self.options[key] = val
+        # Copy the known keys into a plain dict so we can serialise it
+        # properly when it goes into the device and scanner classes. The
+        # keys-view intersection makes this one C-level merge rather than
+        # a Python membership test per stored option.
+        self.options.update({key: entry.options[key] for key in _LOADABLE_OPTIONS & entry.options.keys()})
+
+        # Options only change via a config-entry reload, which rebuilds the
+        # whole coordinator, so hot-path values can be cached as plain
+        # attributes rather than dict lookups per use.
+        self._max_radius: float = self.options.get(CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS)
 
         self.devices: dict[str, BermudaDevice] = {}
         # self.updaters: dict[str, BermudaPBDUCoordinator] = {}
@@ -263,15 +422,20 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         # restore the sensor states even if we don't have a full set of
         # scanner receipts in the discovery data.
         self.scanner_list: list[str] = []
-        if hasattr(entry, "data"):
-            for address, saved in entry.data.get(CONFDATA_SCANNERS, {}).items():
-                scanner = self._get_or_create_device(address)
-                for key, value in saved.items():
-                    if key != "options":
-                        # We don't restore the options, since they may have changed.
-                        # the get_or_create will have grabbed the current ones.
-                        setattr(scanner, key, value)
-                self.scanner_list.append(address)
+        for address, saved in entry.data.get(CONFDATA_SCANNERS, {}).items():
+            scanner = self._get_or_create_device(address)
+            for key, value in saved.items():
+                if key not in ("options", "_idx"):
+                    # We don't restore the options, since they may have changed.
+                    # the get_or_create will have grabbed the current ones,
+                    # and _idx is assigned fresh each session.
+                    setattr(scanner, key, value)
+            if scanner.is_scanner:
+                # The restore may have flipped is_scanner after creation.
+                self._remove_selectable(scanner.address)
+            # Store the canonical form (scanner.address has been through
+            # _normalise_address), so consumers can use the entries as-is.
+            self.scanner_list.append(scanner.address)
 
         hass.services.async_register(
             DOMAIN,
@@ -298,97 +462,165 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                 )
             )
 
+    def _path_loss_indices(self, device: BermudaDevice, scanner) -> tuple[int, int]:
+        """
+        Resolve the factor-matrix indices for a device/scanner pairing.
+
+        The scanner side may be the scanner's own BermudaDevice or a
+        BermudaDeviceScanner entry; the latter is resolved via its address.
+        """
+        scanner_idx = getattr(scanner, "_idx", None)
+        if scanner_idx is None:
+            scanner_idx = self._get_or_create_device(scanner.address)._idx
+        self._ensure_pl_capacity(device._idx, scanner_idx)
+        return device._idx, scanner_idx
+
+    def _ensure_pl_capacity(self, dev_idx: int, scn_idx: int) -> None:
+        """Grow the path-loss matrix (geometrically) to cover the given indices."""
+        rows, cols = self._pl_matrix.shape
+        if dev_idx < rows and scn_idx < cols:
+            return
+        new_rows = max(rows, dev_idx + 1, rows * 2 if dev_idx >= rows else 0)
+        new_cols = max(cols, scn_idx + 1, cols * 2 if scn_idx >= cols else 0)
+        grown = np.full((new_rows, new_cols), 2.0, dtype=np.float32)
+        grown[:rows, :cols] = self._pl_matrix
+        self._pl_matrix = grown
+
     def calculate_path_loss_factor(self, device: BermudaDevice, scanner: BermudaDeviceScanner) -> float:
         """Calculate the path loss factor based on previously measured losses."""
-        path_key = f"{device.address}_{scanner.address}"
-        if path_key not in self.path_loss_factors:
-            # Initialize with a default value if not present
-            self.path_loss_factors[path_key] = 2.0  # Default free space path loss exponent
-        return self.path_loss_factors[path_key]
+        dev_idx, scn_idx = self._path_loss_indices(device, scanner)
+        return float(self._pl_matrix[dev_idx, scn_idx])
 
     def update_path_loss_factor(self, device: BermudaDevice, scanner: BermudaDeviceScanner, measured_loss: float):
         """Update the path loss factor based on real-time measurements."""
-        path_key = f"{device.address}_{scanner.address}"
-        current_factor = self.path_loss_factors.get(path_key, 2.0)
-        
+        dev_idx, scn_idx = self._path_loss_indices(device, scanner)
+
         # Simple moving average update
         alpha = 0.1  # Adjust this value to control the update rate
-        updated_factor = current_factor * (1 - alpha) + measured_loss * alpha
-        
-        self.path_loss_factors[path_key] = updated_factor
+        matrix = self._pl_matrix
+        matrix[dev_idx, scn_idx] = matrix[dev_idx, scn_idx] * (1 - alpha) + measured_loss * alpha
+
+    def _get_obstruction_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return (points, values) arrays mirroring obstruction_map, rebuilding if stale."""
+        if self._obstruction_points is None or len(self.obstruction_map) != self._obstruction_len:
+            self._obstruction_len = len(self.obstruction_map)
+            self._obstruction_points = np.array(list(self.obstruction_map.keys()), dtype=np.float64).reshape(-1, 2)
+            self._obstruction_values = np.array(list(self.obstruction_map.values()), dtype=np.float64)
+        return self._obstruction_points, self._obstruction_values
 
     def get_field_strength_estimate(self, x: float, y: float) -> float:
         """Get field strength estimate from the obstruction map."""
-        # Find the nearest point in the obstruction map
-        nearest_point = min(self.obstruction_map.keys(), key=lambda p: math.hypot(p[0] - x, p[1] - y))
-        return self.obstruction_map[nearest_point]
+        points, values = self._get_obstruction_arrays()
+        # Nearest mapped point, via vectorized squared distances.
+        deltas = points - (x, y)
+        return float(values[np.argmin(np.einsum("ij,ij->i", deltas, deltas))])
+
+    def get_field_strength_estimates(self, points: np.ndarray) -> np.ndarray:
+        """Vectorized field strength estimates for an (N, 2) array of points."""
+        grid_points, values = self._get_obstruction_arrays()
+        deltas = grid_points[None, :, :] - points[:, None, :]
+        return values[np.einsum("ijk,ijk->ij", deltas, deltas).argmin(axis=1)]
 
     def count_wall_crossings(self, start: tuple[float, float], end: tuple[float, float]) -> int:
         """Count the number of wall crossings for a given path."""
         # Simplified implementation - assumes walls are aligned with grid lines
-        wall_crossings = 0
+        if not self.obstruction_map:
+            # No obstruction data gathered, so no known walls.
+            return 0
         x1, y1 = start
         x2, y2 = end
-        
-        for x in range(int(min(x1, x2)), int(max(x1, x2)) + 1):
-            if self.get_field_strength_estimate(x, (y1 + y2) / 2) < self.get_field_strength_estimate(x + 0.5, (y1 + y2) / 2):
-                wall_crossings += 1
-        
-        for y in range(int(min(y1, y2)), int(max(y1, y2)) + 1):
-            if self.get_field_strength_estimate((x1 + x2) / 2, y) < self.get_field_strength_estimate((x1 + x2) / 2, y + 0.5):
-                wall_crossings += 1
-        
-        return wall_crossings
 
-    def apply_path_loss_factor(self, device: BermudaDevice, scanner: BermudaDeviceScanner):
-        """Apply the path loss factor to the calculated vector."""
-        path_loss_factor = self.calculate_path_loss_factor(device, scanner)
-        
-        # Assuming device.position and scanner.position are tuples (x, y)
-        start = device.position
-        end = scanner.position
-        
-        # Calculate distance
-        distance = math.hypot(end[0] - start[0], end[1] - start[1])
-        
-        # Apply path loss factor
-        adjusted_distance = distance ** path_loss_factor
-        
-        # Count wall crossings
-        wall_crossings = self.count_wall_crossings(start, end)
-        
-        # Adjust for wall crossings (simplified - each wall reduces signal by 50%)
-        adjusted_distance *= (0.5 ** wall_crossings)
-        
-        # Update the device's distance to the scanner
-        device.update_distance_to_scanner(scanner, adjusted_distance)
+        # Walk the actual segment once, DDA-style: one sample per unit of
+        # the dominant axis, then a wall is wherever the field strength
+        # drops between consecutive samples. Single batched lookup instead
+        # of separate walks along each axis.
+        steps = int(max(abs(x2 - x1), abs(y2 - y1))) + 1
+        points = np.column_stack(
+            (
+                np.linspace(x1, x2, steps + 1, dtype=np.float64),
+                np.linspace(y1, y2, steps + 1, dtype=np.float64),
+            )
+        )
+        strengths = self.get_field_strength_estimates(points)
+        return int(np.count_nonzero(np.diff(strengths) < 0))
+
+    def apply_path_loss_factors(self, pairs: list[tuple[BermudaDevice, BermudaDevice]]):
+        """
+        Apply path loss factors for a batch of (device, scanner) pairs.
+
+        Gathers positions, factors and wall counts for the whole update
+        cycle into arrays so the distance adjustment is computed with a
+        few vectorized operations instead of per-pair Python math.
+        """
+        usable = [
+            (device, scanner)
+            for device, scanner in pairs
+            if hasattr(device, "position") and hasattr(scanner, "position")
+        ]
+        if not usable:
+            return
+
+        dev_xy = np.array([device.position for device, _ in usable], dtype=np.float64)
+        scn_xy = np.array([scanner.position for _, scanner in usable], dtype=np.float64)
+        factors = np.array([self.calculate_path_loss_factor(device, scanner) for device, scanner in usable])
+        walls = np.array(
+            [self.count_wall_crossings(tuple(device.position), tuple(scanner.position)) for device, scanner in usable]
+        )
+
+        adjusted = batch_distance_adjust(dev_xy, scn_xy, factors, walls)
+
+        for (device, scanner), adjusted_distance in zip(usable, adjusted):
+            device.update_distance_to_scanner(scanner, float(adjusted_distance))
 
     def fine_tune_path_loss_factor(self, device: BermudaDevice):
         """Fine-tune the path loss factor using fixed beacons."""
         for beacon_address in self.fixed_beacons:
             beacon = self.devices.get(beacon_address)
             if beacon and hasattr(beacon, 'position'):
-                for scanner in device.scanners.values():
-                    if scanner.rssi is not None:
-                        # Calculate the actual distance between the beacon and the scanner
-                        actual_distance = math.hypot(beacon.position[0] - scanner.position[0],
-                                                     beacon.position[1] - scanner.position[1])
-                        
-                        # Calculate the estimated distance based on RSSI
-                        estimated_distance = self.calculate_distance_from_rssi(scanner.rssi)
-                        
-                        # Calculate the path loss
-                        measured_loss = math.log(estimated_distance / actual_distance, 10)
-                        
-                        # Update the path loss factor
-                        self.update_path_loss_factor(device, scanner, measured_loss)
-
-    def calculate_distance_from_rssi(self, rssi: float) -> float:
-        """Calculate distance from RSSI using the log-distance path loss model."""
+                # Consume the device's SoA rssi column (EMA-smoothed where
+                # one exists) and resolve scanner positions through the
+                # coordinator's contiguous cache, the same way the
+                # trilateration gather does - scanner entries themselves
+                # don't carry positions.
+                entries = device._scn_entries  # noqa: SLF001
+                rssi_col = device._scn_rssi  # noqa: SLF001
+                scanners = []
+                rows = []
+                rssi_vals = []
+                for slot in np.nonzero(~np.isnan(rssi_col))[0]:
+                    row = self._scanner_index.get(entries[slot].address)
+                    if row is not None:
+                        scanners.append(entries[slot])
+                        rows.append(row)
+                        rssi_vals.append(rssi_col[slot])
+                if not scanners:
+                    continue
+
+                # Batch all scanners for this beacon: actual distances,
+                # RSSI-estimated distances and the measured losses are each
+                # one vectorized expression.
+                scn_xy = self._scanner_xyz[rows]
+                actual_distances = np.hypot(scn_xy[:, 0] - beacon.position[0], scn_xy[:, 1] - beacon.position[1])
+                rssis = np.asarray(rssi_vals, dtype=np.float64)
+                estimated_distances = self.calculate_distance_from_rssi(rssis)
+                measured_losses = np.log10(estimated_distances / actual_distances)
+
+                # Scatter the EMA update into the factor matrix in one go.
+                indices = [self._path_loss_indices(device, scanner) for scanner in scanners]
+                dev_rows = np.array([i for i, _ in indices])
+                scn_cols = np.array([j for _, j in indices])
+                batch_update_plf(self._pl_matrix, dev_rows, scn_cols, measured_losses, alpha=0.1)
+
+    def calculate_distance_from_rssi(self, rssi):
+        """
+        Calculate distance from RSSI using the log-distance path loss model.
+
+        Accepts a scalar or an array of rssi values.
+        """
         # Simplified calculation - adjust constants as needed
         txPower = -59  # Transmit power at 1 meter (adjust based on your device)
         n = 2.0  # Path loss exponent (adjust based on your environment)
-        return 10 ** ((txPower - rssi) / (10 * n))
+        return rssi_to_distance(rssi, txPower, n)
 
     @callback
     def async_handle_advert(
@@ -413,12 +645,15 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             service_info.name,
             service_info,
         )
+        self._advert_seq += 1
         #
         # If there are no configured_devices already present during Bermuda's
         # initial setup, then no sensors will be created, and no updates will
         # be triggered on the co-ordinator. So let's check if we haven't updated
-        # recently, and do so...
-        if self.stamp_last_update < MONOTONIC_TIME() - (UPDATE_INTERVAL * 2):
+        # recently, and do so... The pending flag coalesces advert bursts
+        # into a single scheduled pass.
+        if not self._advert_kick_pending and self.stamp_last_update < MONOTONIC_TIME() - (UPDATE_INTERVAL * 2):
+            self._advert_kick_pending = True
             self.hass.add_job(self._async_update_data())
 
     def sensor_created(self, address):
@@ -468,65 +703,165 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         each has returned an advertisement.
         """
         stamp = MONOTONIC_TIME()
-        results = []
-        for scanner in self.scanner_list:
-            scannerdev = self.devices[scanner]
-            last_stamp: float = 0
-            for device in self.devices.values():
-                record = device.scanners.get(scanner, None)
-                if record is not None and record.stamp is not None:
-                    if record.stamp > last_stamp:
-                        last_stamp = record.stamp
-            results.append(
-                {
-                    "name": scannerdev.name,
-                    "address": scanner,
-                    "last_stamp": last_stamp,
-                    "last_stamp_age": stamp - last_stamp,
-                }
-            )
-        return results
+        # One pass over all devices, tracking the freshest stamp per scanner,
+        # rather than re-scanning the whole device list for each scanner.
+        max_stamps: dict[str, float] = dict.fromkeys(self.scanner_list, 0.0)
+        for device in self.devices.values():
+            for scanner_address, record in device.scanners.items():
+                record_stamp = record.stamp
+                if record_stamp is not None and record_stamp > max_stamps.get(scanner_address, record_stamp):
+                    max_stamps[scanner_address] = record_stamp
+        return [
+            {
+                "name": self.devices[scanner].name,
+                "address": scanner,
+                "last_stamp": max_stamps[scanner],
+                "last_stamp_age": stamp - max_stamps[scanner],
+            }
+            for scanner in self.scanner_list
+        ]
+
+    def _normalise_address(self, address: str) -> str:
+        """Memoised format_mac() - the same raw strings arrive over and over."""
+        mac = self._norm_cache.get(address)
+        if mac is None:
+            if len(self._norm_cache) > PRUNE_MAX_COUNT * 4:
+                # Random MACs can grow this without bound; cheap to rebuild.
+                self._norm_cache.clear()
+            # format_mac tries to return a lower-cased, colon-separated mac
+            # address. Failing that, it returns the original unaltered.
+            mac = format_mac(address).lower()
+            self._norm_cache[address] = mac
+        return mac
 
     def _get_device(self, address: str) -> BermudaDevice | None:
         """Search for a device entry based on mac address."""
-        mac = format_mac(address).lower()
-        # format_mac tries to return a lower-cased, colon-separated mac address.
-        # failing that, it returns the original unaltered.
-        if mac in self.devices:
-            return self.devices[mac]
-        return None
+        return self.devices.get(self._normalise_address(address))
 
     def _get_or_create_device(self, address: str) -> BermudaDevice:
         device = self._get_device(address)
         if device is None:
-            mac = format_mac(address).lower()
+            mac = self._normalise_address(address)
             self.devices[mac] = device = BermudaDevice(address=mac, options=self.options)
             device.address = mac
             device.unique_id = mac
+            # Integer id used to index the path-loss factor matrix,
+            # recycling ids freed by pruning before minting new ones.
+            if self._free_device_idxs:
+                device._idx = self._free_device_idxs.pop()  # noqa: SLF001
+            else:
+                device._idx = self._device_idx_counter  # noqa: SLF001
+                self._device_idx_counter += 1
+            self._classify_selectable(device)
         return device
 
+    def _classify_selectable(self, device: BermudaDevice) -> None:
+        """File a device into the pre-filtered views used by the options flow."""
+        if device.is_scanner or device.address_type == ADDR_TYPE_PRIVATE_BLE_DEVICE:
+            return
+        if device.address_type == ADDR_TYPE_IBEACON:
+            self.selectable_ibeacons[device.address] = device
+        elif device.address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
+            self.selectable_randoms[device.address] = device
+        else:
+            self.selectable_other[device.address] = device
+
+    def _remove_selectable(self, address: str) -> None:
+        """Drop a device from the selectable views (pruned, or now a scanner)."""
+        self.selectable_ibeacons.pop(address, None)
+        self.selectable_randoms.pop(address, None)
+        self.selectable_other.pop(address, None)
+
+    def _gather_trilateration_input(self, device: BermudaDevice) -> tuple[list, list, list] | None:
+        """Collect scanner positions, distances and sigmas for a device, or None if too few."""
+        # Use the device's SoA snapshot so finding usable distances is one
+        # mask op rather than attribute tests on every scanner object.
+        valid = np.nonzero(~np.isnan(device._scn_dist))[0]
+        if len(valid) < 3:
+            return None
+
+        positions = []
+        distances = []
+        sigmas = []
+        # Positions come from the coordinator's contiguous cache, so each
+        # hit is a small dict lookup and an array row rather than a device
+        # lookup plus attribute test.
+        scanner_index = self._scanner_index
+        scanner_xyz = self._scanner_xyz
+        for slot in valid:
+            entry = device._scn_entries[slot]
+            row = scanner_index.get(entry.address)
+            if row is not None:
+                positions.append(scanner_xyz[row])
+                distances.append(float(device._scn_dist[slot]))
+                # Recent rssi scatter as this row's uncertainty, floored so
+                # a momentarily-steady reading can't dominate the solve.
+                hist = entry.hist_rssi
+                sigma = float(np.std(hist)) if len(hist) >= 3 else 1.0
+                sigmas.append(sigma if sigma > 0.5 else 0.5)
+
+        if len(positions) < 3:
+            return None
+        return positions, distances, sigmas
+
     def perform_trilateration(self, device: BermudaDevice):
         """Perform trilateration for a device if enough data is available."""
         if not self.options.get(CONF_ENABLE_TRILATERATION, DEFAULT_ENABLE_TRILATERATION):
             return
 
-        positions = []
-        distances = []
-        for scanner_address, scanner in device.scanners.items():
-            scanner_device = self.devices.get(scanner_address)
-            if scanner.rssi_distance is not None and scanner_device and hasattr(scanner_device, 'position'):
-                positions.append(scanner_device.position)
-                distances.append(scanner.rssi_distance)
+        gathered = self._gather_trilateration_input(device)
+        if gathered is None:
+            return
+        positions, distances, sigmas = gathered
+        try:
+            position = trilaterate(positions, distances, sigmas)
+            if position is not None:
+                # tuple() at the edge; the solver returns an ndarray.
+                device.trilaterated_position = tuple(position.tolist())
+                _LOGGER.debug(f"Trilaterated position for {device.address}: {device.trilaterated_position}")
+            else:
+                _LOGGER.warning(f"Trilateration failed for {device.address}")
+        except Exception as e:
+            _LOGGER.error(f"Error during trilateration for {device.address}: {str(e)}")
 
-        if len(positions) >= 3:
-            try:
-                device.trilaterated_position = trilaterate(positions, distances)
-                if device.trilaterated_position:
-                    _LOGGER.debug(f"Trilaterated position for {device.address}: {device.trilaterated_position}")
-                else:
-                    _LOGGER.warning(f"Trilateration failed for {device.address}")
-            except Exception as e:
-                _LOGGER.error(f"Error during trilateration for {device.address}: {str(e)}")
+    def apply_trilateration_batch(self, batch: list[tuple[BermudaDevice, list, list, list]]):
+        """
+        Solve every gathered device's trilateration in one batched call.
+
+        Pads the per-device inputs to a common width and hands the whole
+        stack to trilaterate_batch, so the linear algebra for the entire
+        update cycle is a single set of NumPy dispatches rather than a
+        solve per device.
+        """
+        if not batch:
+            return
+        width = max(len(positions) for _, positions, _, _ in batch)
+        # float32 to match the solver - the batched tensors are the big
+        # allocation here and RSSI distances don't have the digits for f64.
+        all_pos = np.zeros((len(batch), width, 3), dtype=np.float32)
+        all_dist = np.zeros((len(batch), width), dtype=np.float32)
+        # Pad sigmas with ones so padded slots keep the weights finite;
+        # the mask zeroes their rows out of the solve regardless.
+        all_sig = np.ones((len(batch), width), dtype=np.float32)
+        all_mask = np.zeros((len(batch), width), dtype=bool)
+        for index, (_, positions, distances, sigmas) in enumerate(batch):
+            count = len(positions)
+            all_pos[index, :count] = positions
+            all_dist[index, :count] = distances
+            all_sig[index, :count] = sigmas
+            all_mask[index, :count] = True
+
+        results = trilaterate_batch(all_pos, all_dist, all_mask, all_sig)
+        for (device, _, _, _), row in zip(batch, results):
+            if np.isfinite(row).all():
+                # tolist() so the stored tuple holds plain floats - this
+                # attribute is serialised by to_dict()/diagnostics.
+                device.trilaterated_position = tuple(row.tolist())
+                _LOGGER.debug(f"Trilaterated position for {device.address}: {device.trilaterated_position}")
+            else:
+                # Recurs every cycle for devices with degenerate geometry,
+                # so keep it at debug.
+                _LOGGER.debug(f"Trilateration failed for {device.address}")
 
     async def _async_update_data(self):
         """
@@ -536,6 +871,36 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         (no network requests made etc).
 
         """
+        # Snapshot the clock once for this cycle; every staleness check and
+        # stamp below uses it rather than re-crossing into the C time source.
+        now_mono = MONOTONIC_TIME()
+        # Anchor monotonic-to-wall-clock conversions for this cycle, so
+        # dt_mono_to_datetime is arithmetic rather than two clock reads
+        # per converted stamp.
+        self._time_anchor = (now_mono, now())
+        self._advert_kick_pending = False
+
+        # If no adverts have landed since the last pass and that pass was
+        # within the normal update interval, the whole recompute would be a
+        # no-op - just honour the prune schedule and bail. Pending
+        # scanner/Private-BLE re-inits are exempt: handle_devreg_changes
+        # kicks an update for exactly that work, advert traffic or not.
+        seq_at_start = self._advert_seq
+        if (
+            seq_at_start == self._last_processed_advert_seq
+            and now_mono - self.stamp_last_update < UPDATE_INTERVAL
+            and not (self._do_full_scanner_init or self._do_private_device_init)
+        ):
+            if self.stamp_last_prune < now_mono - PRUNE_TIME_INTERVAL:
+                self.prune_devices()
+                self.stamp_last_prune = now_mono
+            self.last_update_success = True
+            return
+
+        # (device, scanner) pairs seen this cycle, batched so path loss is
+        # applied vectorized in one pass after the advert loop.
+        path_loss_pairs: list[tuple[BermudaDevice, BermudaDevice]] = []
+
         for service_info in bluetooth.async_discovered_service_info(self.hass, False):
             # Note that some of these entries are restored from storage,
             # so we won't necessarily find (immediately, or perhaps ever)
@@ -544,55 +909,66 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             # Get/Create a device entry
             device = self._get_or_create_device(service_info.address)
 
-            # Check if it's broadcasting an Apple Inc manufacturing data (ID: 0x004C)
-            for (
-                company_code,
-                man_data,
-            ) in service_info.advertisement.manufacturer_data.items():
-                # if company_code == 0x00E0:  # 224 Google
-                #     _LOGGER.debug(
-                #         "Found Google Device: %s %s", device.address, man_data.hex()
-                #     )
-                if company_code == 0x004C:  # 76 Apple Inc
-                    # _LOGGER.debug(
-                    #     "Found Apple Manufacturer data: %s %s",
-                    #     device.address,
-                    #     man_data.hex(),
-                    # )
-                    if man_data[:2] == b"\x02\x15":  # 0x0215:  # iBeacon packet
-                        # iBeacon / UUID Support
-
-                        # We provide simplistic support for iBeacons. The
-                        # initial/primary use-case is the companion app
-                        # for Android phones. We are working with these
-                        # assumptions to start with:
-                        # - UUID, Major and Minor are static
-                        # - MAC address may or may not be static
-                        # - We treat a given UUID/Major/Minor combination
-                        #   as being unique. If a device sends multiple
-                        #   ID's we treat it as *wanting* to be seen as multiple
-                        #   devices.
-
-                        # Internally, we still treat the MAC address as the primary
-                        # "entity", but if a beacon payload is attached, we
-                        # essentially create a duplicate BermudaDevice which uses
-                        # the UUID as its "address", and we copy the most recently
-                        # received device's details to it. This allows one to decide
-                        # to track the MAC address or the UUID.
-
-                        # Combining multiple Minor/Major's into one device isn't
-                        # supported at this stage, and I'd suggest doing that sort
-                        # of grouping at a higher level (eg using Groups in HA or
-                        # matching automations on attributes or a subset of
-                        # devices), but if there are prominent use-cases we can
-                        # alter our approach.
-                        #
-
-                        device.beacon_type.add(BEACON_IBEACON_SOURCE)
-                        device.beacon_uuid = man_data[2:18].hex().lower()
-                        device.beacon_major = str(int.from_bytes(man_data[18:20], byteorder="big"))
-                        device.beacon_minor = str(int.from_bytes(man_data[20:22], byteorder="big"))
-                        device.beacon_power = int.from_bytes([man_data[22]], signed=True)
+            # Check if it's broadcasting an Apple Inc manufacturing data (ID: 0x004C).
+            # Direct lookup rather than iterating every company code - the
+            # vast majority of packets carry a single non-Apple entry that
+            # we'd only be skipping over.
+            man_data = service_info.advertisement.manufacturer_data.get(0x004C)  # 76 Apple Inc
+            if man_data is not None:
+                if man_data[:2] == b"\x02\x15":  # 0x0215:  # iBeacon packet
+                    # iBeacon / UUID Support
+
+                    # We provide simplistic support for iBeacons. The
+                    # initial/primary use-case is the companion app
+                    # for Android phones. We are working with these
+                    # assumptions to start with:
+                    # - UUID, Major and Minor are static
+                    # - MAC address may or may not be static
+                    # - We treat a given UUID/Major/Minor combination
+                    #   as being unique. If a device sends multiple
+                    #   ID's we treat it as *wanting* to be seen as multiple
+                    #   devices.
+
+                    # Internally, we still treat the MAC address as the primary
+                    # "entity", but if a beacon payload is attached, we
+                    # essentially create a duplicate BermudaDevice which uses
+                    # the UUID as its "address", and we copy the most recently
+                    # received device's details to it. This allows one to decide
+                    # to track the MAC address or the UUID.
+
+                    # Combining multiple Minor/Major's into one device isn't
+                    # supported at this stage, and I'd suggest doing that sort
+                    # of grouping at a higher level (eg using Groups in HA or
+                    # matching automations on attributes or a subset of
+                    # devices), but if there are prominent use-cases we can
+                    # alter our approach.
+                    #
+
+                    device.beacon_type.add(BEACON_IBEACON_SOURCE)
+                    uuid_bytes, major, minor, power = _IBEACON_STRUCT.unpack_from(man_data, 2)
+                    parsed_beacon = (uuid_bytes, major, minor)
+                    if (
+                        parsed_beacon == device._beacon_last  # noqa: SLF001
+                        and device.beacon_unique_id is not None
+                        and device.beacon_unique_id in self.devices
+                        and device.beacon_unique_id in self.metadevices
+                    ):
+                        # Same payload as last time - the overwhelming
+                        # common case for a stationary beacon. All the
+                        # derived strings are already set, and
+                        # register_ibeacon_source only mutates state on
+                        # first sighting of a source, so skip the lot.
+                        # Only valid while the metadevice still exists:
+                        # a static payload never re-takes the full path,
+                        # so if pruning removed the metadevice we must
+                        # re-register it here.
+                        device.beacon_power = power
+                    else:
+                        device._beacon_last = parsed_beacon  # noqa: SLF001
+                        device.beacon_uuid = uuid_bytes.hex()  # hex() is already lowercase
+                        device.beacon_major = str(major)
+                        device.beacon_minor = str(minor)
+                        device.beacon_power = power
 
                         # So, the irony of having major/minor is that the
                         # UniversallyUniqueIDentifier is not even unique
@@ -613,16 +989,12 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                         # for the sources.
                         self.register_ibeacon_source(device)
 
-                    else:
-                        # apple but not an iBeacon, expose the data in case it's useful.
-                        device.prefname = clean_charbuf(man_data.hex())
-                # else:
-                #     _LOGGER.debug(
-                #         "Found unknown manufacturer %d data: %s %s",
-                #         company_code,
-                #         device.address,
-                #         man_data.hex(),
-                #     )
+                elif device.prefname is None:
+                    # apple but not an iBeacon, expose the data in case it's
+                    # useful. Only when we have nothing better, though -
+                    # unconditionally overwriting re-allocated a hex string
+                    # on every one of these adverts.
+                    device.prefname = clean_charbuf(man_data.hex())
 
             # We probably don't need to do all of this every time, but we
             # want to catch any changes, eg when the system learns the local
@@ -667,12 +1039,16 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
                 # Update the scanner entry on the current device
                 device.update_scanner(scanner_device, discovered)
+                self._dirty_devices.add(device.address)
 
-                # Apply path loss factor and adjust for obstructions
-                self.apply_path_loss_factor(device, scanner_device)
+                # Queue for the batched path loss / obstruction adjustment
+                path_loss_pairs.append((device, scanner_device))
 
             # END of per-advertisement-by-device loop
 
+        # Apply path loss factors and adjust for obstructions, in one batch.
+        self.apply_path_loss_factors(path_loss_pairs)
+
         # If any *configured* devices have not yet been seen, create device
         # entries for them so they will claim the restored sensors in HA
         # (this prevents them from restoring at startup as "Unavailable" if they
@@ -685,13 +1061,37 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Scanner entries have been loaded up with latest data, now we can
         # process data for all devices over all scanners.
+        randoms_cutoff = now_mono - RECENT_RANDOMS_WINDOW
+        tri_enabled = self.options.get(CONF_ENABLE_TRILATERATION, DEFAULT_ENABLE_TRILATERATION)
+        tri_batch: list[tuple[BermudaDevice, list, list, list]] = []
         for device in self.devices.values():
+            # Keep the recently-seen random MACs set current.
+            if device.address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
+                if device.last_seen >= randoms_cutoff:
+                    self.recent_randoms.add(device.address)
+                else:
+                    self.recent_randoms.discard(device.address)
+            if device.address not in self._dirty_devices and not device.create_sensor:
+                # No new adverts and no sensors attached - nothing that
+                # the heavy recalculation below could change. Devices with
+                # sensors always run, so their zone/distance timeouts
+                # still tick over while they're out of range.
+                continue
             # Recalculate smoothed distances, last_seen etc
             device.calculate_data()
-            self.perform_trilateration(device)
+            if device.rssi_dist_changed:
+                self._rssi_dirty.add(device.address)
+            if tri_enabled:
+                # Queue for one batched solve after the loop instead of a
+                # per-device trilateration call.
+                gathered = self._gather_trilateration_input(device)
+                if gathered is not None:
+                    tri_batch.append((device, *gathered))
             self.fine_tune_path_loss_factor(device)
+        self.apply_trilateration_batch(tri_batch)
 
         self._refresh_areas_by_min_distance()
+        self._dirty_devices.clear()
 
         if self._do_full_scanner_init:
             if not self._refresh_scanners():
@@ -699,17 +1099,23 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.update_metadevices()
 
-        for address, device in self.devices.items():
-            if device.create_sensor:
-                if not device.create_sensor_done or not device.create_tracker_done:
-                    _LOGGER.debug("Firing device_new for %s (%s)", device.name, address)
-                    async_dispatcher_send(self.hass, SIGNAL_DEVICE_NEW, address, self.scanner_list)
-
-        if self.stamp_last_prune < MONOTONIC_TIME() - PRUNE_TIME_INTERVAL:
+        # One dispatch for all pending devices - each send invokes every
+        # listener, so per-device sends were O(devices x listeners).
+        pending_new = [
+            address
+            for address, device in self.devices.items()
+            if device.create_sensor and (not device.create_sensor_done or not device.create_tracker_done)
+        ]
+        if pending_new:
+            _LOGGER.debug("Firing device_new_batch for %s", pending_new)
+            async_dispatcher_send(self.hass, SIGNAL_DEVICE_NEW_BATCH, pending_new, self.scanner_list)
+
+        if self.stamp_last_prune < now_mono - PRUNE_TIME_INTERVAL:
             self.prune_devices()
-            self.stamp_last_prune = MONOTONIC_TIME()
+            self.stamp_last_prune = now_mono
 
-        self.stamp_last_update = MONOTONIC_TIME()
+        self._last_processed_advert_seq = seq_at_start
+        self.stamp_last_update = now_mono
         self.last_update_success = True
 
     def prune_devices(self):
@@ -717,44 +1123,74 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         prune_list = []
         prunable_stamps = {}
 
-        metadevice_source_primos = set(metadevice.beacon_sources[0] for metadevice in self.metadevices.values() if metadevice.beacon_sources)
+        # One clock read for the whole pass, with the cutoffs pre-derived.
+        now_mono = MONOTONIC_TIME()
+        irk_cutoff = now_mono - PRUNE_TIME_IRK
+        default_cutoff = now_mono - PRUNE_TIME_DEFAULT
 
-        for device_address, device in self.devices.items():
+        metadevice_source_primos = self._metadevice_primos
+
+        # Candidates come from the pre-bucketed selectable views, so each
+        # pass only walks devices whose address class can actually be pruned
+        # and the IRK-vs-default branch is decided per bucket, not per device.
+        for device_address, device in self.selectable_randoms.items():
             if (
                 device_address not in metadevice_source_primos
                 and (not device.create_sensor)
                 and (not device.is_scanner)
                 and (device.last_seen > 0)
-                and device.address_type != BDADDR_TYPE_NOT_MAC48
             ):
-                if device.address_type == BDADDR_TYPE_PRIVATE_RESOLVABLE:
-                    if device.last_seen < MONOTONIC_TIME() - PRUNE_TIME_IRK:
-                        _LOGGER.debug(
-                            "Marking stale IRK address for pruning: %s",
-                            device.name or device_address,
-                        )
-                        prune_list.append(device_address)
-                    else:
-                        prunable_stamps[device_address] = device.last_seen
-                elif device.last_seen < MONOTONIC_TIME() - PRUNE_TIME_DEFAULT:
+                if device.last_seen < irk_cutoff:
                     _LOGGER.debug(
-                        "Marking old device entry for pruning: %s",
+                        "Marking stale IRK address for pruning: %s",
                         device.name or device_address,
                     )
                     prune_list.append(device_address)
                 else:
                     prunable_stamps[device_address] = device.last_seen
 
+        for bucket in (self.selectable_ibeacons, self.selectable_other):
+            for device_address, device in bucket.items():
+                if (
+                    device_address not in metadevice_source_primos
+                    and (not device.create_sensor)
+                    and (not device.is_scanner)
+                    and (device.last_seen > 0)
+                    and device.address_type != BDADDR_TYPE_NOT_MAC48
+                ):
+                    if device.last_seen < default_cutoff:
+                        _LOGGER.debug(
+                            "Marking old device entry for pruning: %s",
+                            device.name or device_address,
+                        )
+                        prune_list.append(device_address)
+                    else:
+                        prunable_stamps[device_address] = device.last_seen
+
         prune_quota = len(self.devices) - len(prune_list) - PRUNE_MAX_COUNT
         if prune_quota > 0:
-            sorted_addresses = sorted([(v, k) for k, v in prunable_stamps.items()])
+            # We only need the quota-many oldest entries, not a full sort.
+            oldest = heapq.nsmallest(prune_quota, prunable_stamps.items(), key=itemgetter(1))
             _LOGGER.info("Having to prune %s extra devices to make quota.", prune_quota)
-            for _stamp, address in sorted_addresses[:prune_quota]:
+            for address, _stamp in oldest:
                 prune_list.append(address)
 
         for device_address in prune_list:
             _LOGGER.debug("Acting on prune list for %s", device_address)
-            del self.devices[device_address]
+            self.recent_randoms.discard(device_address)
+            self._remove_selectable(device_address)
+            device = self.devices.pop(device_address)
+            idx = device._idx  # noqa: SLF001
+            if idx >= 0:
+                # Release the path-loss index for reuse, wiping the stale
+                # row/column back to the free-space default first. The
+                # same ids serve as scanner columns, hence both axes.
+                rows, cols = self._pl_matrix.shape
+                if idx < rows:
+                    self._pl_matrix[idx, :] = 2.0
+                if idx < cols:
+                    self._pl_matrix[:, idx] = 2.0
+                self._free_device_idxs.append(idx)
 
     def discover_private_ble_metadevices(self):
         """Access the Private BLE Device integration to find metadevices to track."""
@@ -777,6 +1213,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
                         if pb_entity.device_id is not None:
                             pb_device = devreg.async_get(pb_entity.device_id)
+                            self._tracked_devreg_ids.add(pb_entity.device_id)
                         else:
                             pb_device = None
 
@@ -808,7 +1245,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                             source_device.beacon_type.add(BEACON_PRIVATE_BLE_SOURCE)
 
                             if len(metadevice.beacon_sources) == 0 or metadevice.beacon_sources[0] != pb_source_address:
+                                old_primo = metadevice.beacon_sources[0] if metadevice.beacon_sources else None
                                 metadevice.beacon_sources.insert(0, pb_source_address)
+                                if old_primo is not None:
+                                    self._metadevice_primos.discard(old_primo)
+                                self._metadevice_primos.add(pb_source_address)
 
                             self.pb_state_sources[pb_entity.entity_id] = pb_source_address
 
@@ -851,8 +1292,12 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                     metadevice.create_sensor = True
 
             if source_device.address not in metadevice.beacon_sources:
+                old_primo = metadevice.beacon_sources[0] if metadevice.beacon_sources else None
                 metadevice.beacon_sources.insert(0, source_device.address)
                 del metadevice.beacon_sources[HIST_KEEP_COUNT:]
+                if old_primo is not None:
+                    self._metadevice_primos.discard(old_primo)
+                self._metadevice_primos.add(source_device.address)
 
     def update_metadevices(self):
         """Create or update iBeacon, Private_BLE and other meta-devices from the received advertisements."""
@@ -869,41 +1314,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             if latest_source is not None and source_device is not None:
                 metadev.scanners = source_device.scanners
 
-                for attribute in [
-                    "local_name",
-                    "manufacturer",
-                    "name",
-                    "prefname",
-                ]:
-                    if hasattr(metadev, attribute):
-                        if getattr(metadev, attribute) in [None, False]:
-                            setattr(metadev, attribute, getattr(source_device, attribute))
-                    else:
-                        _LOGGER.error(
-                            "Devices don't have a '%s' attribute, this is a bug.",
-                            attribute,
-                        )
-                for attribute in [
-                    "area_distance",
-                    "area_id",
-                    "area_name",
-                    "area_rssi",
-                    "area_scanner",
-                    "beacon_major",
-                    "beacon_minor",
-                    "beacon_power",
-                    "beacon_unique_id",
-                    "beacon_uuid",
-                    "connectable",
-                    "zone",
-                ]:
-                    if hasattr(metadev, attribute):
-                        setattr(metadev, attribute, getattr(source_device, attribute))
-                    else:
-                        _LOGGER.error(
-                            "Devices don't have a '%s' attribute, this is a bug.",
-                            attribute,
-                        )
+                _copy_meta_attrs(metadev, source_device)
 
                 if source_device.last_seen > metadev.last_seen:
                     metadev.last_seen = source_device.last_seen
@@ -919,6 +1330,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
     def dt_mono_to_datetime(self, stamp) -> datetime:
         """Given a monotonic timestamp, convert to datetime object."""
+        if self._time_anchor is not None:
+            # Use the per-cycle anchor - no clock reads needed.
+            mono_ref, wall_ref = self._time_anchor
+            return wall_ref - timedelta(seconds=mono_ref - stamp)
         age = MONOTONIC_TIME() - stamp
         return now() - timedelta(seconds=age)
 
@@ -928,23 +1343,41 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _refresh_areas_by_min_distance(self):
         """Set area for ALL devices based on closest beacon."""
-        for device in self.devices.values():
+        # Only devices whose smoothed distances actually moved can change
+        # their closest scanner. A periodic full pass backstops anything
+        # shifted by means other than a recalculation we saw.
+        self._area_refresh_tick += 1
+        if self._area_refresh_tick >= _AREA_FULL_REFRESH_TICKS:
+            self._area_refresh_tick = 0
+            refreshable = list(self.devices.values())
+        else:
+            refreshable = [
+                device for address in self._rssi_dirty if (device := self.devices.get(address)) is not None
+            ]
+        for device in refreshable:
             if device.is_scanner is not True:
                 self._refresh_area_by_min_distance(device)
+        self._rssi_dirty.clear()
 
     def _refresh_area_by_min_distance(self, device: BermudaDevice):
         """Very basic Area setting by finding closest beacon to a given device."""
         assert device.is_scanner is not True
         closest_scanner: BermudaDeviceScanner | None = None
 
-        for scanner in device.scanners.values():
-            if scanner.rssi_distance is not None and scanner.rssi_distance < self.options.get(
-                CONF_MAX_RADIUS, DEFAULT_MAX_RADIUS
-            ):
-                if closest_scanner is None:
-                    closest_scanner = scanner
-                elif closest_scanner.rssi_distance is None or scanner.rssi_distance < closest_scanner.rssi_distance:
-                    closest_scanner = scanner
+        # One vectorized reduction over the SoA distance column (NaN for
+        # scanners with no distance) replaces the Python comparisons per
+        # scanner entry.
+        # The radius bound is tested once, against the winner, rather than
+        # per candidate; the all-NaN case surfaces as nanargmin's ValueError
+        # instead of a separate full-array scan.
+        dists = device._scn_dist  # noqa: SLF001
+        if dists.size:
+            try:
+                slot = int(np.nanargmin(dists))
+            except ValueError:
+                slot = -1  # no scanner has a distance at all
+            if slot >= 0 and dists[slot] < self._max_radius:
+                closest_scanner = device._scn_entries[slot]  # noqa: SLF001
 
         if closest_scanner is not None:
             old_area = device.area_name
@@ -986,16 +1419,43 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         
         if scanners is not None:
             for scanner in scanners:
-                addresses.add(scanner.scanner.source.lower())
+                # Discovery hands us raw sources, so normalise via the memo
+                # - and format_mac matches the registry index keys where a
+                # bare lower() might not.
+                addresses.add(self._normalise_address(scanner.scanner.source))
 
         if self._do_full_scanner_init:
             update_scannerlist = True
-            for address in self.scanner_list:
-                addresses.add(address.lower())
+            # scanner_list holds canonical addresses already; no per-call
+            # normalisation needed.
+            addresses.update(self.scanner_list)
             self._do_full_scanner_init = False
 
         if len(addresses) > 0:
-            for dev_entry in self.hass.data["device_registry"].devices.data.values():
-                for dev_connection in dev_entry.connections:
-                    if dev_connection[0] in ["mac", "bluetooth"]:
-                        found_address = format_mac(dev_connection[1])
+            if self._devreg_by_mac is None:
+                # (Re)build the reverse index - one registry walk here
+                # instead of one per refresh.
+                self._devreg_by_mac = {}
+                for dev_entry in self.hass.data["device_registry"].devices.data.values():
+                    for dev_connection in dev_entry.connections:
+                        if dev_connection[0] in _MAC_CONNECTION_TYPES:
+                            self._devreg_by_mac[_format_mac_cached(dev_connection[1])] = dev_entry
+            for address in addresses:
+                dev_entry = self._devreg_by_mac.get(address)
+                if dev_entry is not None:
+                    # One of our scanners - remember its registry id
+                    # so we react to its registry updates.
+                    self._tracked_devreg_ids.add(dev_entry.id)
+
+        # Rebuild the contiguous scanner-position cache. Only scanners
+        # with a known position get a row; consumers treat absence from
+        # the index as "no position".
+        xyz: list = []
+        index: dict[str, int] = {}
+        for address in self.scanner_list:
+            position = getattr(self.devices.get(address), "position", None)
+            if position is not None:
+                index[address] = len(xyz)
+                xyz.append(position)
+        self._scanner_xyz = np.asarray(xyz, dtype=np.float64) if xyz else np.empty((0, 3), dtype=np.float64)
+        self._scanner_index = index
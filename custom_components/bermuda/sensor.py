@@ -10,7 +10,7 @@ from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, STATE_UNAVAI
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import _LOGGER, ADDR_TYPE_IBEACON, ADDR_TYPE_PRIVATE_BLE_DEVICE, DOMAIN, SIGNAL_DEVICE_NEW
+from .const import _LOGGER, ADDR_TYPE_IBEACON, ADDR_TYPE_PRIVATE_BLE_DEVICE, DOMAIN, SIGNAL_DEVICE_NEW_BATCH
 from .entity import BermudaEntity
 
 if TYPE_CHECKING:
@@ -33,41 +33,44 @@ async def async_setup_entry(
     created_devices = []  # list of already-created devices
 
     @callback
-    def device_new(address: str, scanners: list[str]) -> None:
+    def device_new(addresses: list[str], scanners: list[str]) -> None:
         """
-        Create entities for newly-found device.
+        Create entities for newly-found devices.
 
-        Called from the data co-ordinator when it finds a new device that needs
+        Called from the data co-ordinator when it finds new devices that need
         to have sensors created. Not called directly, but via the dispatch
-        facility from HA.
+        facility from HA - one signal per update cycle carrying every
+        pending address.
         Make sure you have a full list of scanners ready before calling this.
         """
-        if address not in created_devices:
-            entities = []
-            entities.append(BermudaSensor(coordinator, entry, address))
-            entities.append(BermudaSensorRange(coordinator, entry, address))
-            entities.append(BermudaSensorScanner(coordinator, entry, address))
-            entities.append(BermudaSensorRssi(coordinator, entry, address))
-            entities.append(BermudaSensorTrilateration(coordinator, entry, address))
-
-            for scanner in scanners:
-                entities.append(BermudaSensorScannerRange(coordinator, entry, address, scanner))
-                entities.append(BermudaSensorScannerRangeRaw(coordinator, entry, address, scanner))
-            # _LOGGER.debug("Sensor received new_device signal for %s", address)
+        entities = []
+        for address in addresses:
+            if address not in created_devices:
+                entities.append(BermudaSensor(coordinator, entry, address))
+                entities.append(BermudaSensorRange(coordinator, entry, address))
+                entities.append(BermudaSensorScanner(coordinator, entry, address))
+                entities.append(BermudaSensorRssi(coordinator, entry, address))
+                entities.append(BermudaSensorTrilateration(coordinator, entry, address))
+
+                for scanner in scanners:
+                    entities.append(BermudaSensorScannerRange(coordinator, entry, address, scanner))
+                    entities.append(BermudaSensorScannerRangeRaw(coordinator, entry, address, scanner))
+                created_devices.append(address)
+            else:
+                # We've already created this one.
+                # _LOGGER.debug("Ignoring duplicate creation request for %s", address)
+                pass
+        if entities:
             # We set update before add to False because we are being
             # call(back(ed)) from the update, so causing it to call another would be... bad.
             async_add_devices(entities, False)
-            created_devices.append(address)
-        else:
-            # We've already created this one.
-            # _LOGGER.debug("Ignoring duplicate creation request for %s", address)
-            pass
-        # tell the co-ord we've done it.
-        coordinator.sensor_created(address)
+        for address in addresses:
+            # tell the co-ord we've done it.
+            coordinator.sensor_created(address)
 
     # Connect device_new to a signal so the coordinator can call it
     _LOGGER.debug("Registering device_new callback.")
-    entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DEVICE_NEW, device_new))
+    entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_DEVICE_NEW_BATCH, device_new))
 
 
 class BermudaSensor(BermudaEntity, SensorEntity):
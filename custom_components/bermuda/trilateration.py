@@ -1,27 +1,241 @@
 """Trilateration calculations for Bermuda."""
 
+from math import sqrt
 from typing import List, Tuple
 import numpy as np
 
-def trilaterate(positions: List[Tuple[float, float, float]], distances: List[float]) -> Tuple[float, float, float]:
+# Scratch buffers reused across trilaterate() calls, grown on demand.
+# These only serve the scalar path, which Bermuda's coordinator drives
+# from the event loop - single-threaded, so no threading.local needed.
+_SCRATCH_N = 16
+_SCRATCH_A = np.empty((_SCRATCH_N - 1, 3), dtype=np.float32)
+_SCRATCH_B = np.empty(_SCRATCH_N - 1, dtype=np.float32)
+_SCRATCH_SQ = np.empty(_SCRATCH_N, dtype=np.float32)
+
+def _solve3_cholesky(ata, atb) -> Tuple[float, float, float]:
+    """
+    Solve the 3x3 SPD normal equations by a hand-rolled Cholesky.
+
+    For a system this small the LAPACK call behind np.linalg.solve costs
+    more in dispatch than the ~30 flops of the factorisation itself, so
+    the scalar path does the arithmetic in plain Python floats instead.
+    Raises LinAlgError on non-positive-definite input (degenerate
+    scanner geometry) so callers keep their existing fallback.
+    """
+    a00 = float(ata[0, 0])
+    a10 = float(ata[1, 0])
+    a11 = float(ata[1, 1])
+    a20 = float(ata[2, 0])
+    a21 = float(ata[2, 1])
+    a22 = float(ata[2, 2])
+    b0 = float(atb[0])
+    b1 = float(atb[1])
+    b2 = float(atb[2])
+
+    if a00 <= 0:
+        raise np.linalg.LinAlgError("matrix not positive definite")
+    l00 = sqrt(a00)
+    l10 = a10 / l00
+    l20 = a20 / l00
+    t = a11 - l10 * l10
+    if t <= 0:
+        raise np.linalg.LinAlgError("matrix not positive definite")
+    l11 = sqrt(t)
+    l21 = (a21 - l20 * l10) / l11
+    t = a22 - l20 * l20 - l21 * l21
+    if t <= 0:
+        raise np.linalg.LinAlgError("matrix not positive definite")
+    l22 = sqrt(t)
+
+    # Forward then back substitution.
+    y0 = b0 / l00
+    y1 = (b1 - l10 * y0) / l11
+    y2 = (b2 - l20 * y0 - l21 * y1) / l22
+    x2 = y2 / l22
+    x1 = (y1 - l21 * x2) / l11
+    x0 = (y0 - l10 * x1 - l20 * x2) / l00
+    return (x0, x1, x2)
+
+def _trilaterate3_closed(P: np.ndarray, d: np.ndarray) -> np.ndarray | None:
+    """
+    Closed-form solution for exactly three scanners.
+
+    Builds an orthonormal basis in the scanners' plane and intersects
+    the spheres directly - pure arithmetic, no factorisation or
+    substitution. Returns None for (near-)collinear scanners so the
+    caller can fall back to the general least-squares path.
+    """
+    p1 = P[0]
+    ex = P[1] - p1
+    base = float(np.linalg.norm(ex))
+    if base < 1e-6:
+        return None
+    ex /= base
+    v = P[2] - p1
+    i = float(ex @ v)
+    ey = v - i * ex
+    j = float(np.linalg.norm(ey))
+    if j < 1e-6:
+        return None
+    ey /= j
+
+    r1 = float(d[0])
+    r2 = float(d[1])
+    r3 = float(d[2])
+    x = (r1 * r1 - r2 * r2 + base * base) / (2 * base)
+    y = (r1 * r1 - r3 * r3 + i * i + j * j) / (2 * j) - (i / j) * x
+    return p1 + x * ex + y * ey
+
+def trilaterate(
+    positions: List[Tuple[float, float, float]],
+    distances: List[float],
+    sigmas: List[float] | None = None,
+) -> np.ndarray | None:
     """
     Perform trilateration to estimate the position of a device.
 
     Args:
     positions (List[Tuple[float, float, float]]): List of (x, y, z) coordinates of the scanners.
     distances (List[float]): List of distances from each scanner to the device.
+    sigmas (List[float] | None): Optional per-scanner uncertainty. When given,
+        the solve is weighted so noisier scanners pull the estimate less.
 
     Returns:
-    Tuple[float, float, float]: Estimated (x, y, z) position of the device.
+    Estimated position as a (3,) float32 ndarray, ready for further
+    vector maths without re-boxing; None if the solve fails. Callers
+    that want plain Python values can tuple() at their edge.
     """
-    A = 2 * np.array([positions[i] for i in range(1, len(positions))]) - 2 * np.array(positions[0])
-    b = np.array([distances[0]**2 - distances[i]**2 - np.sum(positions[0]**2) + np.sum(positions[i]**2) for i in range(1, len(positions))])
-    
+    # Build the linearised system in whole-array operations - the previous
+    # per-row comprehensions re-summed the reference position every
+    # iteration and broke when handed plain tuples.
+    # float32 throughout: RSSI-derived distances carry two or three
+    # significant digits, so single precision loses nothing and halves
+    # the memory traffic (np.linalg.solve keeps f32 via LAPACK sgesv).
+    P = np.ascontiguousarray(positions, dtype=np.float32)
+    d = np.asarray(distances, dtype=np.float32)
+
+    # Exactly three scanners - the common case in a home - has a direct
+    # planar solution; weighting is moot there since the system is
+    # exactly determined and every row is satisfied regardless.
+    if P.shape[0] == 3:
+        estimated = _trilaterate3_closed(P, d)
+        if estimated is not None:
+            return estimated
+
+    # Fill views of the module scratch in place rather than allocating
+    # fresh A/b/sq arrays per call - allocation dominates at this size.
+    global _SCRATCH_N, _SCRATCH_A, _SCRATCH_B, _SCRATCH_SQ
+    n = P.shape[0]
+    if n > _SCRATCH_N:
+        _SCRATCH_N = n
+        _SCRATCH_A = np.empty((n - 1, 3), dtype=np.float32)
+        _SCRATCH_B = np.empty(n - 1, dtype=np.float32)
+        _SCRATCH_SQ = np.empty(n, dtype=np.float32)
+    A = _SCRATCH_A[: n - 1]
+    b = _SCRATCH_B[: n - 1]
+    sq = _SCRATCH_SQ[:n]
+    np.subtract(P[1:], P[0], out=A)
+    A *= 2
+    np.einsum("ij,ij->i", P, P, out=sq)
+    np.multiply(d[1:], d[1:], out=b)
+    np.negative(b, out=b)
+    b += d[0] * d[0] - sq[0]
+    b += sq[1:]
+
+    if sigmas is not None:
+        # Each row couples the reference scanner with scanner i, so its
+        # weight combines both uncertainties.
+        s = np.asarray(sigmas, dtype=np.float32)
+        w = 1.0 / np.sqrt(s[1:] ** 2 + s[0] ** 2)
+        A *= w[:, None]
+        b *= w
+
+    # Solve the 3x3 normal equations directly - lstsq runs a full SVD,
+    # which is overkill for the handful of rows a BLE fix ever has.
     try:
-        estimated_position = np.linalg.lstsq(A, b, rcond=None)[0]
-        return tuple(estimated_position)
+        estimated_position = np.array(_solve3_cholesky(A.T @ A, A.T @ b), dtype=np.float32)
     except np.linalg.LinAlgError:
-        return None
+        # Degenerate geometry (eg collinear scanners): fall back to the
+        # minimum-norm solution.
+        try:
+            estimated_position = np.linalg.lstsq(A, b, rcond=None)[0]
+        except np.linalg.LinAlgError:
+            return None
+    return estimated_position
+
+def trilaterate_batch(
+    positions: np.ndarray,
+    distances: np.ndarray,
+    mask: np.ndarray,
+    sigmas: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Solve many trilaterations in one batched call.
+
+    Args:
+    positions: (D, N, 3) scanner coordinates, padded to the widest device.
+    distances: (D, N) measured distances for the same slots.
+    mask: (D, N) validity of each slot; padding is False. Slot 0 must be
+        valid for every device, as it is the linearisation reference.
+    sigmas: optional (D, N) per-scanner uncertainty, weighting the solve
+        like trilaterate() does; pad with a nonzero value (e.g. 1.0).
+
+    Returns:
+    (D, 3) estimated positions. Devices with singular geometry get NaN rows.
+    """
+    # Same construction as trilaterate(), broadcast over the device axis.
+    # Invalid rows are zeroed, so they contribute nothing to the normal
+    # equations regardless of what the padding holds.
+    A = 2 * (positions[:, 1:] - positions[:, :1])
+    sq = np.einsum("dij,dij->di", positions, positions)
+    b = distances[:, :1] ** 2 - distances[:, 1:] ** 2 - sq[:, :1] + sq[:, 1:]
+    if sigmas is not None:
+        # Each row couples the reference scanner with scanner i, so the
+        # weight combines both uncertainties - same as the scalar path.
+        w = 1.0 / np.sqrt(sigmas[:, 1:] ** 2 + sigmas[:, :1] ** 2)
+        A = A * w[..., None]
+        b = b * w
+    rows = mask[:, 1:]
+    A = A * rows[..., None]
+    b = b * rows
+
+    AtA = A.transpose(0, 2, 1) @ A
+    Atb = A.transpose(0, 2, 1) @ b[..., None]
+    try:
+        return np.linalg.solve(AtA, Atb).squeeze(-1)
+    except np.linalg.LinAlgError:
+        # At least one device has a singular normal matrix - exactly
+        # three scanners, or a coplanar layout, both of which are normal
+        # deployments. Fall back to the scalar solver per device: it
+        # dispatches n==3 to the closed form and rank deficiency to
+        # lstsq, so one such device doesn't void the whole batch.
+        out = np.full((positions.shape[0], 3), np.nan, dtype=positions.dtype)
+        for index in range(positions.shape[0]):
+            rows = mask[index]
+            estimate = trilaterate(
+                positions[index][rows],
+                distances[index][rows],
+                None if sigmas is None else sigmas[index][rows],
+            )
+            if estimate is not None:
+                out[index] = estimate
+        return out
+
+
+def calculate_accuracy_batch(estimated_positions, actual_positions) -> np.ndarray:
+    """
+    Calculate accuracies for many position pairs at once.
+
+    Args:
+    estimated_positions: (N, 3) estimated positions.
+    actual_positions: (N, 3) actual positions (if known).
+
+    Returns:
+    (N,) Euclidean distances between each estimated/actual pair, in one
+    vectorised norm rather than a Python loop of scalar calls.
+    """
+    return np.linalg.norm(np.asarray(estimated_positions) - np.asarray(actual_positions), axis=-1)
+
 
 def calculate_accuracy(estimated_position: Tuple[float, float, float], actual_position: Tuple[float, float, float]) -> float:
     """
@@ -34,4 +248,5 @@ def calculate_accuracy(estimated_position: Tuple[float, float, float], actual_po
     Returns:
     float: The Euclidean distance between the estimated and actual positions.
     """
-    return np.linalg.norm(np.array(estimated_position) - np.array(actual_position))
+    # Thin wrapper over the batch form so there's one distance formula.
+    return float(calculate_accuracy_batch(estimated_position, actual_position))
@@ -3,6 +3,35 @@
 from __future__ import annotations
 
 
+class _RssiToMetresLut:
+    """
+    Precomputed rssi -> metres lookup table.
+
+    Valid rssi values all fit in a signed byte, so a 256-entry table
+    indexed by ``rssi + 128`` replaces the pow() call on the per-advert
+    hot path. The table is lazily (re)built whenever the calibration
+    parameters change, which covers options reloads.
+    """
+
+    def __init__(self) -> None:
+        self._table: list[float] = []
+        self._params: tuple[float, float] | None = None
+
+    def lookup(self, rssi, ref_power, attenuation):
+        params = (ref_power, attenuation)
+        if params != self._params:
+            self._params = params
+            self._table = [10 ** ((ref_power - (index - 128)) / (10 * attenuation)) for index in range(256)]
+        index = int(rssi) + 128
+        if rssi == int(rssi) and 0 <= index < 256:
+            return self._table[index]
+        # Fractional (rssi offset calibration) or out-of-range value.
+        return 10 ** ((ref_power - rssi) / (10 * attenuation))
+
+
+_RSSI_LUT = _RssiToMetresLut()
+
+
 def rssi_to_metres(rssi, ref_power=None, attenuation=None):
     """
     Convert instant rssi value to a distance in metres.
@@ -28,7 +57,7 @@ def rssi_to_metres(rssi, ref_power=None, attenuation=None):
         return False
         # attenuation= self.attenuation
 
-    return 10 ** ((ref_power - rssi) / (10 * attenuation))
+    return _RSSI_LUT.lookup(rssi, ref_power, attenuation)
 
 
 def clean_charbuf(instring: str | None) -> str:
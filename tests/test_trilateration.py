@@ -0,0 +1,125 @@
+"""Test Bermuda's trilateration solvers."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from custom_components.bermuda.trilateration import calculate_accuracy
+from custom_components.bermuda.trilateration import calculate_accuracy_batch
+from custom_components.bermuda.trilateration import trilaterate
+from custom_components.bermuda.trilateration import trilaterate_batch
+
+TRUE_POSITION = (3.2, 1.7, 0.9)
+
+# An over-determined, non-coplanar layout the general solver handles.
+SCANNERS = [(0.0, 0.0, 0.0), (6.0, 0.0, 0.0), (0.0, 6.0, 0.0), (6.0, 6.0, 2.5), (3.0, 3.0, 3.0)]
+
+
+def _distances(scanners, position):
+    """Exact scanner-to-position distances for synthetic fixes."""
+    return [float(np.linalg.norm(np.subtract(position, scanner))) for scanner in scanners]
+
+
+def test_trilaterate_recovers_known_position():
+    """The general least-squares path recovers an exact synthetic fix."""
+    estimate = trilaterate(SCANNERS, _distances(SCANNERS, TRUE_POSITION))
+    assert estimate is not None
+    assert calculate_accuracy(estimate, TRUE_POSITION) < 1e-3
+
+
+def test_trilaterate_three_scanners():
+    """Exactly three scanners - the common deployment - must still solve."""
+    scanners = SCANNERS[:3]
+    position = (2.5, 1.2, 0.0)  # in the scanners' plane
+    estimate = trilaterate(scanners, _distances(scanners, position))
+    assert estimate is not None
+    assert calculate_accuracy(estimate, position) < 1e-3
+
+
+def test_trilaterate_batch_matches_scalar():
+    """
+    Batched results agree with the scalar solver, including the singular
+    cases: a three-scanner device and a coplanar layout make the batched
+    normal equations rank-deficient, which must not void the batch or
+    return NaN rows for solvable devices.
+    """
+    coplanar = [(0.0, 0.0, 0.0), (6.0, 0.0, 0.0), (0.0, 6.0, 0.0), (6.0, 6.0, 0.0)]
+    devices = [
+        (SCANNERS, TRUE_POSITION),  # over-determined
+        (SCANNERS[:3], (2.5, 1.2, 0.0)),  # exactly three scanners
+        (coplanar, (2.0, 3.0, 0.0)),  # everyone at z=0
+    ]
+    width = max(len(scanners) for scanners, _ in devices)
+    positions = np.zeros((len(devices), width, 3), dtype=np.float32)
+    distances = np.zeros((len(devices), width), dtype=np.float32)
+    mask = np.zeros((len(devices), width), dtype=bool)
+    for index, (scanners, position) in enumerate(devices):
+        count = len(scanners)
+        positions[index, :count] = scanners
+        distances[index, :count] = _distances(scanners, position)
+        mask[index, :count] = True
+
+    results = trilaterate_batch(positions, distances, mask)
+    for index, (scanners, position) in enumerate(devices):
+        assert np.isfinite(results[index]).all(), f"device {index} returned {results[index]}"
+        scalar = trilaterate(scanners, _distances(scanners, position))
+        assert calculate_accuracy(results[index], scalar) < 1e-2
+
+
+def test_coordinator_batch_path_is_weighted():
+    """
+    The coordinator's gather and batched apply drive the weighted solver
+    end to end: positions resolve via the scanner index, sigmas derive
+    from rssi scatter, and a corrupted reading from a noisy scanner
+    pulls the estimate less than the unweighted solve would allow. Also
+    guards the solver imports in coordinator.py - this fails with
+    NameError if they go missing.
+    """
+    from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
+
+    true_position = np.array([3.0, 2.0, 1.0])
+    scanner_xyz = np.array(SCANNERS, dtype=np.float64)
+    distances = np.linalg.norm(scanner_xyz - true_position, axis=1)
+    distances[3] += 2.0  # corrupted reading from the noisy scanner
+
+    class _Scanner:
+        def __init__(self, address, hist_rssi):
+            self.address = address
+            self.hist_rssi = hist_rssi
+
+    steady_hist = [-60.0, -60.0, -61.0]
+    noisy_hist = [-50.0, -70.0, -55.0, -65.0]
+    entries = [_Scanner(f"scanner{slot}", noisy_hist if slot == 3 else steady_hist) for slot in range(len(SCANNERS))]
+
+    class _Device:
+        address = "aa:bb:cc:dd:ee:ff"
+        trilaterated_position = None
+
+    device = _Device()
+    device._scn_entries = entries
+    device._scn_dist = distances.astype(np.float32)
+
+    coordinator = object.__new__(BermudaDataUpdateCoordinator)
+    coordinator._scanner_index = {entry.address: row for row, entry in enumerate(entries)}
+    coordinator._scanner_xyz = scanner_xyz
+
+    gathered = coordinator._gather_trilateration_input(device)
+    assert gathered is not None
+    positions, gathered_distances, sigmas = gathered
+    assert sigmas[3] > sigmas[0]  # the noisy scanner carries more uncertainty
+
+    coordinator.apply_trilateration_batch([(device, positions, gathered_distances, sigmas)])
+    assert device.trilaterated_position is not None
+    # Plain floats only - the attribute is serialised by dump_devices.
+    assert all(type(value) is float for value in device.trilaterated_position)
+    weighted_error = calculate_accuracy(device.trilaterated_position, true_position)
+    unweighted_error = calculate_accuracy(trilaterate(positions, gathered_distances), true_position)
+    assert weighted_error < unweighted_error
+
+
+def test_calculate_accuracy_batch():
+    """The batched accuracy matches per-pair Euclidean distances."""
+    estimated = [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]
+    actual = [[3.0, 4.0, 0.0], [1.0, 1.0, 2.0]]
+    assert np.allclose(calculate_accuracy_batch(estimated, actual), [5.0, 1.0])
+    assert abs(calculate_accuracy(estimated[0], actual[0]) - 5.0) < 1e-6